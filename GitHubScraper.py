@@ -44,6 +44,8 @@ class GitHubScraper:
         }
         if api_token:
             self.headers["Authorization"] = f"token {api_token}"
+        # ETag of each successful endpoint response, for callers that revalidate caches
+        self.etags: Dict[str, str] = {}
 
         # Fetch data
         self.user_data = self.get_user_profile()
@@ -79,6 +81,8 @@ class GitHubScraper:
                     logging.warning(f"Low API rate limit: {remaining} requests remaining")
 
             if response.status_code == 200:
+                if response.headers.get('ETag'):
+                    self.etags[endpoint] = response.headers['ETag']
                 return response.json()
             elif response.status_code == 404:
                 logging.error(f"Resource not found: {endpoint}")
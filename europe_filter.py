@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, List, Tuple
 import pandas as pd
 from fuzzywuzzy import fuzz
@@ -65,6 +66,8 @@ class EuropeFilter:
 
     def __init__(self, world_df: pd.DataFrame):
         self.world_df = world_df
+        # Batches repeat the same locations/universities/employers; memoize per input triple
+        self._check_eligibility_cached = lru_cache(maxsize=4096)(self._check_eligibility)
 
     def _normalize(self, s: str) -> str:
         return s.strip().lower()
@@ -146,25 +149,36 @@ class EuropeFilter:
             # Try to get location from LinkedIn data if available
             current_location = linkedin_data.get("location", "") or ""
 
-        if current_location and self.check_location(str(current_location)):
-            return True, f"passed: current_location ({current_location})"
-
-        # 2. University location
+        # 2. University
         school = (
             row.get("education.degreeFields1")
             or row.get("education.pleaseSpecify")
             or row.get("education.degreeFields", "")
         )
-        if school and self.check_university(str(school)):
+
+        # 3. Employer locations (from LinkedIn experience entries)
+        employer_locations = tuple(
+            exp.get("location")
+            for exp in linkedin_data.get("experience", [])
+            if exp.get("location")
+        )
+
+        return self._check_eligibility_cached(
+            str(current_location).strip(), str(school or "").strip(), employer_locations
+        )
+
+    def _check_eligibility(
+        self, current_location: str, school: str, employer_locations: Tuple[str, ...]
+    ) -> Tuple[bool, str]:
+        """Uncached OR-logic check behind is_eligible; arguments are hashable so results can be memoized."""
+        if current_location and self.check_location(current_location):
+            return True, f"passed: current_location ({current_location})"
+
+        if school and self.check_university(school):
             return True, f"passed: university ({school})"
 
-        # 3. Employer location (from LinkedIn experience entries)
-        if self.check_employer(linkedin_data):
-            # Find the matching location for the reason string
-            for exp in linkedin_data.get("experience", []):
-                loc = exp.get("location", "")
-                if loc and self.check_location(loc):
-                    return True, f"passed: employer_location ({loc})"
-            return True, "passed: employer_location"
+        for loc in employer_locations:
+            if self.check_location(loc):
+                return True, f"passed: employer_location ({loc})"
 
         return False, "rejected: all criteria non-European"
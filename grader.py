@@ -1,21 +1,80 @@
 
 import pandas as pd
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process, utils
 from ollama_wrapper import OllamaClient
 from GitHubScraper import GitHubScraper
 from verifier.parser import ResumeParser
 from verifier.cross_verifier import CrossVerifier
 from website_scraper import WebsiteScraper
 from LinkedInScraper import LinkedinScraper
-from scraper import get_selenium_drivers
+from scraper import get_selenium_drivers, wait_for_page_load
+import diskcache
+import hashlib
+from collections import Counter
 import statistics
 import re
 import math
 import json
 import os
 
+# Row fields that feed grade_applicant; a change in any of them invalidates the cached grades
+RELEVANT_COLS = [
+    'firstName',
+    'lastName',
+    'countryOfOrigin',
+    'education.degreeFields',
+    'education.degreeFields1',
+    'education.pleaseSpecify',
+    'githubUrl',
+    'linkedinUrl',
+    'personalWebsite',
+    'uploadResume',
+    'editGrid.whatIsTheNameOfTheCompany',
+    'editGrid.whatIsYourRoleInTheCompany',
+    'editGrid.describeYourStartupIn23Sentences',
+    'whichEntrepreneurshipProgramsAcceleratorsClubsHaveYouBeenPartOf',
+    'tellYouALittleBitMoreAboutYouThen200Words',
+    'whyWouldYouLikeToJoinEuroTechFederationAsAFellowWhatCouldYouContributeToTheCommunity',
+    'whatIsTheMostImpressiveThingYouveAchievedMax150Words',
+    'listTheThingsYouveBuiltAppsToolsWebsitesOpenSourceProjectsAddUrLsIfPossibleIfSeveralSeparateWithSemicolons',
+]
+
+# Scraped LinkedIn profiles are reused across runs for a day
+LINKEDIN_CACHE_TTL = 24 * 60 * 60
+
+# Cached grades are recomputed after a week even if the row is unchanged
+GRADES_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Trigram candidate filter for school lookups: only names sharing enough trigrams with the query get scored
+TRIGRAM_MIN_OVERLAP = 2
+TRIGRAM_MAX_CANDIDATES = 50
+
+
+def _trigrams(text):
+    """Word-level padded trigrams, so token order does not affect overlap (matches token_sort_ratio)."""
+    grams = set()
+    for word in text.lower().split():
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _sort_tokens(text):
+    """Normalise and token-sort once, so fuzz.ratio on the result equals token_sort_ratio."""
+    return " ".join(sorted(utils.default_process(text).split()))
+
+
+def _build_trigram_index(names):
+    """Map each trigram to the indexes of the names containing it."""
+    index = {}
+    for i, name in enumerate(names):
+        for gram in _trigrams(name):
+            index.setdefault(gram, set()).add(i)
+    return index
+
+
 class Grader:
-    def __init__(self, use_scraping=True):
+    def __init__(self, use_scraping=True, use_cache=True, cache_dir='.grades_cache', linkedin_cache_dir=None, attach_running=True):
         self.daur_df = pd.read_csv('daur_rankings_2024.csv')
         self.world_df = pd.read_csv('average_ranking_with_region.csv')
         self.ollama = OllamaClient(model="llama3.2:3b")
@@ -23,11 +82,34 @@ class Grader:
         self.ollama = OllamaClient(model="llama3.2:3b")
         self.use_scraping = use_scraping
         self.scraped_data_cache = {}
+        self._website_scraper = WebsiteScraper()
+        # Trigram indexes over the school names, keyed by the name column of each ranking
+        self._school_names = {
+            'Name': self.daur_df['Name'].dropna().tolist(),
+            'University Name': self.world_df['University Name'].dropna().tolist(),
+        }
+        self._school_trigrams = {
+            col: _build_trigram_index(names) for col, names in self._school_names.items()
+        }
+        self._school_sorted_tokens = {
+            col: [_sort_tokens(n) for n in names] for col, names in self._school_names.items()
+        }
+        # Persistent grade cache keyed by row hash: re-running on an unchanged CSV skips scraping + LLM calls
+        self.grades_cache = diskcache.Cache(cache_dir) if use_cache else None
+        # Optional on-disk cache of scraped LinkedIn data (expires after LINKEDIN_CACHE_TTL)
+        self.linkedin_cache = (
+            diskcache.Cache(linkedin_cache_dir) if use_cache and linkedin_cache_dir else None
+        )
+        # Set by any scrape/parse/LLM failure during grade_applicant; such grades aren't cached
+        self._degraded = False
         self.driver = None
         if self.use_scraping:
              try:
                  # Try to connect to existing debug chrome or start headless
-                 # Using port 9222 as default
+                 # Using port 9222 as default. Parallel graders must not share that
+                 # browser's tab, so they pass attach_running=False and go straight to headless
+                 if not attach_running:
+                     raise RuntimeError("attaching to a running Chrome is disabled")
                  self.driver = get_selenium_drivers(running=True, portnumber=9222)
              except:
                  print("   [Grader] Could not connect to running Chrome, trying to start new instance...")
@@ -44,23 +126,31 @@ class Grader:
             if school_name == "nan":
                  return None, 0
             
-        best_match = None
-        best_score = 0
-        
         # Simple exact match check first
         if school_name in df[name_col].values:
             return school_name, 100
-            
-        # Optimization: Only check first letter match to speed up?
-        # Or just run full scan, dataset is small enough (<200 lines for DAUR, <1000 for World)
-        
-        for name in df[name_col].dropna():
-            score = fuzz.token_sort_ratio(school_name.lower(), name.lower())
-            if score > best_score:
-                best_score = score
-                best_match = name
-        
-        return best_match, best_score
+
+        names = self._school_names[name_col]
+        sorted_names = self._school_sorted_tokens[name_col]
+        trigram_index = self._school_trigrams[name_col]
+
+        # Narrow the scan to names sharing at least a few trigrams with the query
+        overlap = Counter()
+        for gram in _trigrams(school_name):
+            overlap.update(trigram_index.get(gram, ()))
+        candidates = {
+            i: sorted_names[i] for i, count in overlap.most_common(TRIGRAM_MAX_CANDIDATES)
+            if count >= TRIGRAM_MIN_OVERLAP
+        }
+        if not candidates:
+            candidates = dict(enumerate(sorted_names))
+
+        # Corpus is pre-normalised and token-sorted, so plain ratio is enough
+        match = process.extractOne(_sort_tokens(school_name), candidates, scorer=fuzz.ratio)
+        if match is None:
+            return None, 0
+        _, score, i = match
+        return names[i], score
 
     def grade_education(self, row):
         """
@@ -183,22 +273,31 @@ class Grader:
             return data
         except Exception as e:
             print(f"   [Scraper] GitHub Error: {e}")
+            self._degraded = True
             return {}
 
     def _scrape_linkedin(self, linkedin_url):
-        if not self.use_scraping or not self.driver or not isinstance(linkedin_url, str) or "linkedin.com" not in linkedin_url:
+        if not self.use_scraping or not isinstance(linkedin_url, str) or "linkedin.com" not in linkedin_url:
+            return {}
+        if not self.driver:
+            # Selenium failed to start: the profile exists but couldn't be scraped
+            self._degraded = True
             return {}
             
         if linkedin_url in self.scraped_data_cache:
             return self.scraped_data_cache[linkedin_url]
+
+        if self.linkedin_cache is not None:
+            data = self.linkedin_cache.get(linkedin_url)
+            if data is not None:
+                self.scraped_data_cache[linkedin_url] = data
+                return data
             
         print(f"   [Scraper] Fetching LinkedIn data for {linkedin_url}...")
         try:
             driver = self.driver
             driver.get(linkedin_url)
-            # Basic wait for load
-            import time
-            time.sleep(3)
+            wait_for_page_load(driver)
             
             page_source = driver.page_source
             scraper = LinkedinScraper(page_source, driver, save=False)
@@ -212,9 +311,12 @@ class Grader:
             }
             
             self.scraped_data_cache[linkedin_url] = data
+            if self.linkedin_cache is not None:
+                self.linkedin_cache.set(linkedin_url, data, expire=LINKEDIN_CACHE_TTL)
             return data
         except Exception as e:
             print(f"   [Scraper] LinkedIn Error: {e}")
+            self._degraded = True
             return {}
 
     def _parse_resume(self, resume_path):
@@ -251,11 +353,13 @@ class Grader:
             return {
                 "summary": summary,
                 "raw_text": data.get("raw_text", ""),
+                "raw_text_lower": data.get("raw_text_lower", ""),
                 "education": data.get("education", []),
                 "skills": data.get("skills", [])
             }
         except Exception as e:
             print(f"   [Resume] Error: {e}")
+            self._degraded = True
             return {}
 
     def _get_ollama_grade(self, criteria, prompt_context):
@@ -285,7 +389,10 @@ class Grader:
         regex = r'\b([0-9]{1,3})\b'
         
         for _ in range(5):
-            response = self.ollama.generate_completion(full_prompt, system_prompt=system_prompt)
+            # The score is the first few tokens: stop decoding before any trailing explanation
+            response = self.ollama.generate_completion(
+                full_prompt, system_prompt=system_prompt, stop=["\n", ".", ","], num_predict=8
+            )
             if response:
                 matches = re.findall(regex, response)
                 if matches:
@@ -297,6 +404,7 @@ class Grader:
                         pass
         
         if not scores:
+            self._degraded = True
             return 0
             
         scores.sort(reverse=True)
@@ -337,7 +445,28 @@ class Grader:
             """
         return ""
 
-    def grade_applicant(self, row):
+    def _row_hash(self, row):
+        """Stable hash of the row fields that grade_applicant depends on (and the resume file's version)."""
+        relevant = {col: row.get(col) for col in RELEVANT_COLS}
+        # The resume is referenced by path: a replaced file must not reuse the old grades
+        resume_path = row.get('uploadResume')
+        if isinstance(resume_path, str) and os.path.exists(resume_path):
+            stat = os.stat(resume_path)
+            relevant['uploadResume.version'] = (stat.st_mtime_ns, stat.st_size)
+        return hashlib.blake2b(repr(relevant).encode()).hexdigest()
+
+    def grade_applicant(self, row, linkedin_data=None):
+        row_hash = None
+        if self.grades_cache is not None:
+            row_hash = self._row_hash(row)
+            if row_hash in self.grades_cache:
+                print("   [Cache] Row unchanged since last run, reusing grades.")
+                return self.grades_cache[row_hash]
+
+        # A caller that scraped LinkedIn itself has already reset the flag before doing so;
+        # keep any failure it recorded
+        if linkedin_data is None:
+            self._degraded = False
         grades = {}
         
         # Education
@@ -362,9 +491,10 @@ class Grader:
         website_data = {}
         if website_url and isinstance(website_url, str) and website_url.startswith("http"):
             print(f"   [Website] Scraping {website_url}...")
-            website_data = WebsiteScraper().scrape(website_url)
+            website_data = self._website_scraper.scrape(website_url)
             if website_data.get("error"):
                 print(f"   [Website] {website_data['error']}")
+                self._degraded = True
 
         # Parse Resume
         resume_path = row.get('uploadResume')
@@ -376,13 +506,16 @@ class Grader:
             resume_website = resume_data.get("links", {}).get("website", "")
             if resume_website and resume_website.startswith("http"):
                 print(f"   [Website] Scraping {resume_website} (from resume)...")
-                website_data = WebsiteScraper().scrape(resume_website)
+                website_data = self._website_scraper.scrape(resume_website)
                 if website_data.get("error"):
                     print(f"   [Website] {website_data['error']}")
+                    self._degraded = True
 
-        # Scrape LinkedIn
-        linkedin_url = row.get('linkedinUrl')
-        scraped_li_data = self._scrape_linkedin(linkedin_url)
+        # Scrape LinkedIn (unless the caller already did)
+        if linkedin_data is not None:
+            scraped_li_data = linkedin_data
+        else:
+            scraped_li_data = self._scrape_linkedin(row.get('linkedinUrl'))
         
         # Cross Verification
         form_data_for_verifier = {
@@ -451,7 +584,11 @@ class Grader:
         DISCREPANCIES: {verification_report['discrepancies']}
         """
         grades['Startup'] = self._get_ollama_grade('Startup', start_context)
-        
+
+        # Grades built on a failed scrape or LLM call are retried on the next run instead
+        if row_hash is not None and not self._degraded:
+            self.grades_cache.set(row_hash, grades, expire=GRADES_CACHE_TTL)
+
         return grades
 
     def __del__(self):
@@ -6,7 +6,7 @@ import sys
 import os
 
 
-def main(index: int = 0):
+def main(index: int = 0, use_cache: bool = True):
     print("Loading data...")
     try:
         df = pd.read_csv('input.csv')
@@ -25,7 +25,7 @@ def main(index: int = 0):
     print(f"Processing applicant: {name} (Index {index})")
 
     # Initialize grader
-    grader = Grader()
+    grader = Grader(use_cache=use_cache)
 
     print("Grading...")
     grades = grader.grade_applicant(row)
@@ -65,6 +65,11 @@ if __name__ == "__main__":
         default="output",
         help="Directory for charts and logs in batch mode (default: output)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached grades and re-score every candidate from scratch"
+    )
     parser.add_argument(
         "index",
         nargs="?",
@@ -76,6 +81,6 @@ if __name__ == "__main__":
 
     if args.batch:
         from pipeline import BatchPipeline
-        BatchPipeline(csv_path=args.csv, output_dir=args.output_dir).run()
+        BatchPipeline(csv_path=args.csv, output_dir=args.output_dir, use_cache=not args.no_cache).run()
     else:
-        main(args.index)
+        main(args.index, use_cache=not args.no_cache)
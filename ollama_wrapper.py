@@ -8,9 +8,10 @@ class OllamaClient:
         self.model = model
         self.logger = logging.getLogger(__name__)
 
-    def generate_completion(self, prompt: str, system_prompt: str = None) -> str:
+    def generate_completion(self, prompt: str, system_prompt: str = None, stop: list = None, num_predict: int = None) -> str:
         """
         Generates a completion from Ollama.
+        `stop` and `num_predict` let the server end decoding early when only a short answer is needed.
         """
         url = f"{self.base_url}/api/generate"
         
@@ -23,6 +24,14 @@ class OllamaClient:
         if system_prompt:
             payload["system"] = system_prompt
 
+        options = {}
+        if stop:
+            options["stop"] = stop
+        if num_predict is not None:
+            options["num_predict"] = num_predict
+        if options:
+            payload["options"] = options
+
         try:
             response = requests.post(url, json=payload)
             response.raise_for_status()
@@ -8,27 +8,45 @@ Usage:
 The pipeline:
   1. Optionally syncs CVs from Google Drive (if GOOGLE_DRIVE_FOLDER_ID is set in .env).
   2. Filters candidates to Europe-only (OR logic: current location / university / employer).
-  3. Grades eligible candidates with Grader.grade_applicant().
-  4. Writes status + grades back to the CSV after every candidate (crash-safe).
+  3. Grades eligible candidates with Grader.grade_applicant(), across PIPELINE_WORKERS
+     processes (default 1), each owning its own Grader and Selenium driver.
+  4. Streams the candidates in CHUNK_SIZE-row chunks, journaling status + grades to
+     output/progress.jsonl after every candidate (crash-safe). Finished chunks go to the
+     <csv>.feather sidecar, the authoritative progress store; the CSV is exported from it
+     once the whole file has been processed. Later runs read the sidecar unless the CSV
+     has been modified since.
   5. Logs per-candidate output to output/logs/<name>.log.
 
 Status values written to the 'status' column:
-  pending          — not yet processed (initial state)
-  processing       — currently being processed (set before starting)
+  pending          — not yet processed (initial state); stays pending until the result is
+                     journaled, so candidates interrupted by a crash are retried on the next run
+  processing       — written by older versions before starting a row; reset to pending on load
   done             — grading complete
   failed           — an exception occurred (see error_message column)
   rejected_europe  — did not pass the Europe eligibility filter
 """
 
 import os
+import json
 import logging
+import multiprocessing
+import multiprocessing.util
+import string
 import traceback
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from europe_filter import EuropeFilter
+    from grader import Grader
+
 load_dotenv()
 
 STATUS_PENDING = "pending"
@@ -52,72 +70,270 @@ PIPELINE_COLUMNS = {
     "processed_at": None,
 }
 
+RANKINGS_CSV = "average_ranking_with_region.csv"
+RANKINGS_FEATHER = "average_ranking_with_region.feather"
+# Explicit dtypes skip type inference when the CSV has to be parsed
+RANKINGS_DTYPES = {
+    "University Name": str,
+    "QS Rank": "float64",
+    "THE Rank": "float64",
+    "ARWU Rank": "float64",
+    "Mean Rank": "float64",
+    "Median Rank": "float64",
+    "Source Count": "float64",
+    "Country": str,
+    "Region": str,
+}
+
+# Rows held in memory at a time when streaming the candidate CSV
+CHUNK_SIZE = 50_000
+# Numeric pipeline columns; every other column is read as text, so the CSV round-trips
+# verbatim, type inference is skipped and each chunk maps to the same Arrow schema
+FLOAT_COLUMNS = [
+    "grade_Education",
+    "grade_Community",
+    "grade_HackProject",
+    "grade_Research",
+    "grade_Startup",
+    "trust_score",
+]
+CANDIDATE_DTYPES = defaultdict(lambda: str, {col: "float64" for col in FLOAT_COLUMNS})
+
+# Maps every ASCII character that is not alphanumeric, '-' or '_' to '_' (for log filenames)
+_SAFE_TABLE = {i: "_" for i in range(128)}
+_SAFE_TABLE.update({ord(c): c for c in string.ascii_letters + string.digits + "-_"})
+
+
+def _json_default(value):
+    """Serialize numpy scalars (and anything else pandas hands back) for the journal."""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+# Per-process pipeline used by Pool workers (set by _init_worker)
+_worker_pipeline = None
+
+
+def _init_worker(csv_path: str, output_dir: str, use_cache: bool) -> None:
+    """Pool initializer: each worker process builds its own Grader (and Selenium driver)."""
+    global _worker_pipeline
+    _worker_pipeline = BatchPipeline(csv_path=csv_path, output_dir=output_dir, use_cache=use_cache)
+    # Workers run side by side: each needs its own headless Chrome, not a shared debug tab
+    _worker_pipeline.attach_running = False
+    _worker_pipeline._load_shared_resources()
+    # Runs when the worker exits normally (pool.close() + join()); quits its Chrome/chromedriver
+    multiprocessing.util.Finalize(None, _close_worker, exitpriority=10)
+
+
+def _close_worker() -> None:
+    """Pool worker exit hook: quit the worker Grader's Selenium driver."""
+    grader = _worker_pipeline.grader
+    if grader.driver:
+        grader.driver.quit()
+        grader.driver = None
+
+
+def _process_one(item):
+    """Pool task: process one (idx, row_dict, has_linkedin) item and return (idx, updates)."""
+    idx, row, has_linkedin = item
+    return idx, _worker_pipeline._process_candidate(idx, row, has_linkedin)
+
 
 class BatchPipeline:
-    def __init__(self, csv_path: str, output_dir: str = "output"):
+    def __init__(self, csv_path: str, output_dir: str = "output", use_cache: bool = True):
         self.csv_path = csv_path
+        self.use_cache = use_cache
         self.output_dir = output_dir
         self.logs_dir = os.path.join(output_dir, "logs")
         self.cvs_dir = "cvs"
+        self.journal_path = os.path.join(output_dir, "progress.jsonl")
+        self.feather_path = csv_path + ".feather"
+        # Whether the Grader may attach to a Chrome already running on the debug port
+        self.attach_running = True
+        self._journal = None
+        self._feather_writer = None
+        # Loggers are built once per name; stdout handler + formatter are shared by all of them
+        self._loggers = {}
+        self._log_format = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+        self._stdout_handler = logging.StreamHandler()
+        self._stdout_handler.setLevel(logging.INFO)
+        self._stdout_handler.setFormatter(self._log_format)
+
+    def _read_journal(self) -> dict:
+        """Collect updates journaled by an interrupted run, merged per row index."""
+        updates = {}
+        if not os.path.exists(self.journal_path):
+            return updates
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-write
+                    continue
+                updates.setdefault(entry.pop("idx"), {}).update(entry)
+        return updates
 
-    def _load_or_initialize_csv(self) -> pd.DataFrame:
-        """Load CSV and add missing pipeline columns with default values."""
-        df = pd.read_csv(self.csv_path)
-        for col, default in PIPELINE_COLUMNS.items():
-            if col not in df.columns:
-                df[col] = default
-        # Rows with no status yet → mark as pending
-        df["status"] = df["status"].fillna(STATUS_PENDING)
-        return df
-
-    def _save_progress(self, df: pd.DataFrame) -> None:
-        """Write the full DataFrame back to CSV immediately."""
-        df.to_csv(self.csv_path, index=False)
+    def _read_chunks(self):
+        """
+        Yield raw chunks from the Feather sidecar when it is at least as new as the CSV,
+        otherwise parse the CSV. Chunk indexes continue across chunks.
+        """
+        if (
+            os.path.exists(self.feather_path)
+            and os.path.getmtime(self.feather_path) >= os.path.getmtime(self.csv_path)
+        ):
+            start = 0
+            with pa.memory_map(self.feather_path) as source:
+                reader = pa.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    chunk = reader.get_batch(i).to_pandas()
+                    chunk.index = pd.RangeIndex(start, start + len(chunk))
+                    start += len(chunk)
+                    # Arrow nulls come back as None; use NaN like read_csv does
+                    yield chunk.where(chunk.notna(), np.nan)
+        else:
+            yield from pd.read_csv(self.csv_path, chunksize=CHUNK_SIZE, dtype=CANDIDATE_DTYPES)
+
+    def _iter_candidates(self, journal_updates: dict):
+        """Stream candidate chunks with missing pipeline columns added and journaled updates replayed."""
+        for chunk in self._read_chunks():
+            for col, default in PIPELINE_COLUMNS.items():
+                if col not in chunk.columns:
+                    chunk[col] = default
+            chunk = chunk.astype({col: "float64" for col in FLOAT_COLUMNS})
+            # Rows with no status yet → mark as pending
+            chunk["status"] = chunk["status"].fillna(STATUS_PENDING)
+            for idx in chunk.index.intersection(list(journal_updates)):
+                updates = journal_updates[idx]
+                chunk.loc[idx, list(updates)] = list(updates.values())
+            # Rows left 'processing' by an interrupted run are retried
+            chunk["status"] = chunk["status"].replace(STATUS_PROCESSING, STATUS_PENDING)
+            yield chunk
+
+    def _load_rankings(self) -> pd.DataFrame:
+        """Load the world rankings, caching a Feather copy of the CSV for faster re-reads."""
+        if (
+            os.path.exists(RANKINGS_FEATHER)
+            and os.path.getmtime(RANKINGS_FEATHER) >= os.path.getmtime(RANKINGS_CSV)
+        ):
+            return pd.read_feather(RANKINGS_FEATHER)
+        world_df = pd.read_csv(RANKINGS_CSV, dtype=RANKINGS_DTYPES)
+        # Pool workers may rebuild it at the same time: each writes its own temp file and
+        # swaps it in atomically, so no reader ever sees a half-written copy
+        tmp_path = f"{RANKINGS_FEATHER}.{os.getpid()}.tmp"
+        world_df.to_feather(tmp_path)
+        os.replace(tmp_path, RANKINGS_FEATHER)
+        return world_df
+
+    def _journal_row(self, idx, updates: dict) -> None:
+        """Append a single-row delta to the progress journal."""
+        self._journal.write(json.dumps({"idx": int(idx), **updates}, default=_json_default) + "\n")
+
+    def _write_chunk(self, chunk: pd.DataFrame) -> None:
+        """Append a finished chunk to the temporary Feather sidecar (the first chunk starts it)."""
+        schema = pa.schema([
+            (col, pa.float64() if col in FLOAT_COLUMNS else pa.string()) for col in chunk.columns
+        ])
+        table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+        if self._feather_writer is None:
+            self._feather_writer = pa.ipc.new_file(self.feather_path + ".tmp", schema)
+        self._feather_writer.write_table(table)
+
+    def _export_csv_final(self) -> None:
+        """Write the user-facing CSV from the Feather sidecar, one record batch at a time."""
+        tmp_path = self.csv_path + ".tmp"
+        with pa.memory_map(self.feather_path) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                reader.get_batch(i).to_pandas().to_csv(
+                    tmp_path, mode="w" if i == 0 else "a", header=i == 0, index=False
+                )
+        os.replace(tmp_path, self.csv_path)
+
+    def _finalize_output(self) -> None:
+        """Swap the finished sidecar into place, export the CSV, then drop the journal it supersedes."""
+        self._feather_writer.close()
+        self._feather_writer = None
+        os.replace(self.feather_path + ".tmp", self.feather_path)
+        self._export_csv_final()
+        # The sidecar holds the same data as the CSV just exported; mark it current for the next run
+        os.utime(self.feather_path)
+        self._journal.seek(0)
+        self._journal.truncate()
 
     def _setup_logger(self, name: str) -> logging.Logger:
-        """Create a per-candidate logger writing to output/logs/<name>.log and stdout."""
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        """Create (or reuse) a per-candidate logger writing to output/logs/<name>.log and stdout."""
+        if name in self._loggers:
+            return self._loggers[name]
+
+        # ASCII names go through the translate table; others keep their Unicode alphanumerics
+        # (李 and 张 must not collapse to the same file)
+        if name.isascii():
+            safe_name = name.translate(_SAFE_TABLE)
+        else:
+            safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
         log_path = os.path.join(self.logs_dir, f"{safe_name}.log")
 
         logger = logging.getLogger(f"candidate.{safe_name}")
         logger.setLevel(logging.DEBUG)
+        logger.propagate = False
         logger.handlers.clear()
 
-        fh = logging.FileHandler(log_path, encoding="utf-8")
+        # delay=True: the log file is only opened on the first record
+        fh = logging.FileHandler(log_path, encoding="utf-8", delay=True)
         fh.setLevel(logging.DEBUG)
-        sh = logging.StreamHandler()
-        sh.setLevel(logging.INFO)
-
-        fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
-        fh.setFormatter(fmt)
-        sh.setFormatter(fmt)
+        fh.setFormatter(self._log_format)
 
         logger.addHandler(fh)
-        logger.addHandler(sh)
+        logger.addHandler(self._stdout_handler)
+        self._loggers[name] = logger
         return logger
 
-    def _match_cv_to_row(self, df: pd.DataFrame, downloaded_paths: list) -> pd.DataFrame:
+    def _match_cv_to_row(self, df: pd.DataFrame, downloaded_paths: list) -> list:
         """
         For newly downloaded CVs, try to update the uploadResume column in df
         by matching filename substrings against candidate first/last names.
         Best-effort: skips rows where no confident match is found.
+        Returns the paths without a full-name match, to be tried against later chunks.
         """
+        # Lowercase the name columns once instead of per (file, row) pair; a missing
+        # column matches nothing, as row.get() did
+        empty = pd.Series("", index=df.index)
+        first_lc = df.get("firstName", empty).fillna("").astype(str).str.lower().to_numpy()
+        last_lc = df.get("lastName", empty).fillna("").astype(str).str.lower().to_numpy()
+        resume_col = df.columns.get_loc("uploadResume")
+        n = len(df)
+        unmatched = []
+
         for local_path in downloaded_paths:
             filename = os.path.basename(local_path).lower()
-            for idx, row in df.iterrows():
-                first = str(row.get("firstName", "")).lower()
-                last = str(row.get("lastName", "")).lower()
-                if first and last and first in filename and last in filename:
-                    df.at[idx, "uploadResume"] = local_path
-                    break
-                # Fallback: just last name
-                elif last and len(last) > 3 and last in filename:
-                    if pd.isna(df.at[idx, "uploadResume"]) or str(df.at[idx, "uploadResume"]).startswith("http"):
-                        df.at[idx, "uploadResume"] = local_path
-        return df
+            full_mask = np.fromiter(
+                (bool(f) and bool(l) and f in filename and l in filename for f, l in zip(first_lc, last_lc)),
+                dtype=bool, count=n,
+            )
+            last_mask = np.fromiter(
+                (len(l) > 3 and l in filename for l in last_lc),
+                dtype=bool, count=n,
+            )
+            # Rows are scanned in order and the first full-name hit ends the scan,
+            # so last-name fallbacks only apply to rows before it
+            stop = int(np.argmax(full_mask)) if full_mask.any() else n
+
+            resume = df["uploadResume"]
+            replaceable = (resume.isna() | resume.astype(str).str.startswith("http")).to_numpy()
+            fallback = np.flatnonzero(last_mask[:stop] & replaceable[:stop])
+            if fallback.size:
+                df.iloc[fallback, resume_col] = local_path
+            if stop < n:
+                df.iloc[stop, resume_col] = local_path
+            else:
+                unmatched.append(local_path)
+        return unmatched
 
     def run(self) -> None:
-        """Main entry point. Process all pending candidates sequentially."""
+        """Main entry point. Process all pending candidates, optionally across worker processes."""
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(self.logs_dir, exist_ok=True)
         os.makedirs(self.cvs_dir, exist_ok=True)
@@ -125,9 +341,12 @@ class BatchPipeline:
         root_logger = self._setup_logger("pipeline")
         root_logger.info(f"BatchPipeline started. CSV: {self.csv_path}")
 
-        df = self._load_or_initialize_csv()
+        journal_updates = self._read_journal()
+        # Line-buffered so each journaled row reaches the OS before the next candidate starts
+        self._journal = open(self.journal_path, "a", encoding="utf-8", buffering=1)
 
-        # Step 1: Sync CVs from Google Drive if configured
+        # Step 1: Sync CVs from Google Drive if configured (matched to rows chunk by chunk below)
+        downloaded = []
         drive_folder = os.environ.get("GOOGLE_DRIVE_FOLDER_ID", "")
         if drive_folder:
             root_logger.info("Google Drive folder detected — syncing CVs...")
@@ -136,109 +355,197 @@ class BatchPipeline:
                 downloader = get_downloader_from_env()
                 if downloader:
                     downloader.authenticate()
-                    downloaded = downloader.sync_folder(self.cvs_dir)
-                    if downloaded:
-                        df = self._match_cv_to_row(df, downloaded)
-                        self._save_progress(df)
+                    downloaded = downloader.sync_folder(self.cvs_dir) or []
             except Exception as e:
                 root_logger.warning(f"Drive sync failed: {e}. Continuing with local files.")
 
-        # Step 2: Load shared resources
-        root_logger.info("Loading world rankings for Europe filter...")
-        world_df = pd.read_csv("average_ranking_with_region.csv")
+        # Step 2: Process pending rows, one chunk at a time. Workers (or the in-process
+        # Grader) are only started once a chunk actually has pending candidates
+        workers = int(os.getenv("PIPELINE_WORKERS", "1"))
+        pool = None
+        pending_total = 0
+        status_counts = Counter()
+
+        try:
+            for chunk in self._iter_candidates(journal_updates):
+                # A header-only CSV yields a single empty chunk
+                if chunk.empty:
+                    continue
+                if downloaded and "uploadResume" in chunk.columns:
+                    before = chunk["uploadResume"].copy()
+                    downloaded = self._match_cv_to_row(chunk, downloaded)
+                    changed = chunk.index[chunk["uploadResume"].ne(before) & chunk["uploadResume"].notna()]
+                    for idx in changed:
+                        self._journal_row(idx, {"uploadResume": chunk.at[idx, "uploadResume"]})
+
+                pending_idx = np.flatnonzero(chunk["status"].to_numpy() == STATUS_PENDING)
+                root_logger.info(f"{len(pending_idx)} candidate(s) pending in rows {chunk.index[0]}-{chunk.index[-1]}.")
+                pending_total += len(pending_idx)
+                if len(pending_idx) and workers > 1 and pool is None:
+                    root_logger.info(f"Starting {workers} worker processes (one Grader each)...")
+                    pool = multiprocessing.Pool(
+                        processes=workers,
+                        initializer=_init_worker,
+                        initargs=(self.csv_path, self.output_dir, self.use_cache),
+                    )
+
+                # Vectorized once per chunk instead of a per-row isinstance/substring check
+                has_linkedin = (
+                    chunk["linkedinUrl"].fillna("").str.contains("linkedin.com", regex=False).to_numpy()
+                    if "linkedinUrl" in chunk.columns
+                    else np.zeros(len(chunk), dtype=bool)
+                )
+                items = (
+                    (chunk.index[i], chunk.iloc[i].to_dict(), bool(has_linkedin[i]))
+                    for i in pending_idx
+                )
+                self._apply_results(chunk, self._run_candidates(items, pool))
+
+                self._write_chunk(chunk)
+                status_counts.update(chunk["status"].value_counts().to_dict())
+
+            # Only a fully streamed file replaces the sidecar and CSV; after an interruption
+            # the journal carries the progress into the next run instead
+            if self._feather_writer is not None:
+                self._finalize_output()
+            # Let workers exit cleanly so their finalizers quit each Selenium driver
+            if pool is not None:
+                pool.close()
+                pool.join()
+                pool = None
+        finally:
+            # Only reached with a live pool on the error path
+            if pool is not None:
+                pool.terminate()
+            if self._feather_writer is not None:
+                self._feather_writer.close()
+                self._feather_writer = None
+            self._journal.close()
+            self._journal = None
+
+        if not pending_total:
+            root_logger.info("No pending candidates; skipped Grader and Europe filter startup.")
+        done_count = status_counts[STATUS_DONE]
+        rejected_count = status_counts[STATUS_REJECTED]
+        failed_count = status_counts[STATUS_FAILED]
+        root_logger.info(
+            f"Pipeline finished. Done: {done_count}, Rejected (Europe): {rejected_count}, Failed: {failed_count}"
+        )
 
+    @cached_property
+    def europe_filter(self) -> "EuropeFilter":
+        """Europe filter over the world rankings, built on first use."""
+        self._setup_logger("pipeline").info("Loading world rankings for Europe filter...")
         from europe_filter import EuropeFilter
-        europe_filter = EuropeFilter(world_df)
+        return EuropeFilter(self._load_rankings())
 
-        root_logger.info("Initializing Grader (Selenium + Ollama)...")
+    @cached_property
+    def grader(self) -> "Grader":
+        """Grader (Selenium + Ollama), built on first use and reused by later runs in this process."""
+        self._setup_logger("pipeline").info("Initializing Grader (Selenium + Ollama)...")
         from grader import Grader
-        from visualizer import plot_pentagram
-        grader = Grader()
-
-        # Step 3: Process pending rows
-        pending_mask = df["status"] == STATUS_PENDING
-        pending_count = pending_mask.sum()
-        root_logger.info(f"{pending_count} candidate(s) pending.")
-
-        for idx in df[pending_mask].index:
-            row = df.loc[idx]
-            first = str(row.get("firstName", "")).strip()
-            last = str(row.get("lastName", "")).strip()
-            name = f"{first} {last}".strip() or f"candidate_{idx}"
-
-            logger = self._setup_logger(name)
-            logger.info(f"--- Processing: {name} (row {idx}) ---")
+        return Grader(
+            use_cache=self.use_cache,
+            linkedin_cache_dir=os.path.join(self.output_dir, "linkedin_cache"),
+            attach_running=self.attach_running,
+        )
 
-            # Mark as processing immediately
-            df.at[idx, "status"] = STATUS_PROCESSING
-            self._save_progress(df)
+    def _load_shared_resources(self) -> None:
+        """Eagerly build the Europe filter and Grader used by _process_candidate (worker start-up)."""
+        self.europe_filter
+        self.grader
+
+    def _run_candidates(self, items, pool):
+        """Yield (idx, updates) for each (idx, row, has_linkedin) item, on the worker pool if there is one."""
+        if pool is not None:
+            return pool.imap_unordered(_process_one, items, chunksize=1)
+        return (
+            (idx, self._process_candidate(idx, row, has_linkedin)) for idx, row, has_linkedin in items
+        )
 
-            try:
-                # Step 3a: Pre-scrape LinkedIn to populate cache for Europe filter
-                linkedin_url = row.get("linkedinUrl", "")
-                linkedin_data = {}
-                if isinstance(linkedin_url, str) and "linkedin.com" in linkedin_url:
-                    logger.info("Pre-scraping LinkedIn for Europe filter...")
-                    linkedin_data = grader._scrape_linkedin(linkedin_url)
-
-                # Step 3b: Europe filter
-                eligible, reason = europe_filter.is_eligible(row, linkedin_data)
-                df.at[idx, "europe_reason"] = reason
-
-                if not eligible:
-                    logger.info(f"REJECTED (Europe filter): {reason}")
-                    df.at[idx, "status"] = STATUS_REJECTED
-                    df.at[idx, "processed_at"] = datetime.utcnow().isoformat()
-                    self._save_progress(df)
-                    continue
+    def _apply_results(self, df: pd.DataFrame, results) -> None:
+        """Write (idx, updates) results into df and the journal as they arrive."""
+        for idx, updates in results:
+            # One indexer call per candidate; the same dict is what gets journaled
+            df.loc[idx, list(updates)] = list(updates.values())
+            self._journal_row(idx, updates)
 
-                logger.info(f"Europe filter: {reason}")
-
-                # Step 3c: Grade
-                logger.info("Grading candidate...")
-                grades = grader.grade_applicant(row)
-
-                # Step 3d: Write results
-                df.at[idx, "grade_Education"] = grades.get("Education")
-                df.at[idx, "grade_Community"] = round(grades.get("Community", 0), 1)
-                df.at[idx, "grade_HackProject"] = round(grades.get("Hack/Project", 0), 1)
-                df.at[idx, "grade_Research"] = round(grades.get("Research", 0), 1)
-                df.at[idx, "grade_Startup"] = round(grades.get("Startup", 0), 1)
-
-                verification = grades.get("Verification", {})
-                df.at[idx, "trust_score"] = verification.get("trust_score")
-
-                # Step 3e: Generate chart
-                safe_name = name.replace(" ", "_")
-                chart_path = os.path.join(self.output_dir, f"grade_{safe_name}.png")
-                plot_pentagram(grades, chart_path)
-                df.at[idx, "chart_path"] = chart_path
-
-                df.at[idx, "status"] = STATUS_DONE
-                df.at[idx, "processed_at"] = datetime.utcnow().isoformat()
-                logger.info(
-                    f"Done. Education={grades.get('Education')} "
-                    f"Community={round(grades.get('Community', 0), 1)} "
-                    f"Hack={round(grades.get('Hack/Project', 0), 1)} "
-                    f"Research={round(grades.get('Research', 0), 1)} "
-                    f"Startup={round(grades.get('Startup', 0), 1)} "
-                    f"Trust={verification.get('trust_score')}"
-                )
+    def _process_candidate(self, idx, row, has_linkedin: bool) -> dict:
+        """Europe-filter and grade one candidate. Returns the pipeline-column updates for its row."""
+        from visualizer import plot_pentagram
 
-            except Exception as e:
-                error_msg = f"{type(e).__name__}: {e}"
-                logger.error(f"FAILED: {error_msg}")
-                logger.debug(traceback.format_exc())
-                df.at[idx, "status"] = STATUS_FAILED
-                df.at[idx, "error_message"] = error_msg
-                df.at[idx, "processed_at"] = datetime.utcnow().isoformat()
-
-            finally:
-                self._save_progress(df)
-
-        done_count = (df["status"] == STATUS_DONE).sum()
-        rejected_count = (df["status"] == STATUS_REJECTED).sum()
-        failed_count = (df["status"] == STATUS_FAILED).sum()
-        root_logger.info(
-            f"Pipeline finished. Done: {done_count}, Rejected (Europe): {rejected_count}, Failed: {failed_count}"
-        )
+        first = str(row.get("firstName", "")).strip()
+        last = str(row.get("lastName", "")).strip()
+        name = f"{first} {last}".strip() or f"candidate_{idx}"
+
+        logger = self._setup_logger(name)
+        logger.info(f"--- Processing: {name} (row {idx}) ---")
+
+        # One timestamp per candidate, shared by the rejected/done/failed branches
+        processed_at = datetime.utcnow().isoformat()
+        updates = {}
+        try:
+            # Step 2a: Pre-scrape LinkedIn to populate cache for Europe filter. A failure here
+            # must still keep this candidate's grades out of the cache
+            self.grader._degraded = False
+            linkedin_data = {}
+            if has_linkedin:
+                logger.info("Pre-scraping LinkedIn for Europe filter...")
+                linkedin_data = self.grader._scrape_linkedin(row["linkedinUrl"])
+
+            # Step 2b: Europe filter
+            eligible, reason = self.europe_filter.is_eligible(row, linkedin_data)
+            updates["europe_reason"] = reason
+
+            if not eligible:
+                logger.info(f"REJECTED (Europe filter): {reason}")
+                updates["status"] = STATUS_REJECTED
+                updates["processed_at"] = processed_at
+                return updates
+
+            logger.info(f"Europe filter: {reason}")
+
+            # Step 2c: Grade
+            logger.info("Grading candidate...")
+            grades = self.grader.grade_applicant(row, linkedin_data=linkedin_data)
+
+            # Step 2d: Stage results
+            updates["grade_Education"] = grades.get("Education")
+            updates["grade_Community"] = round(grades.get("Community", 0), 1)
+            updates["grade_HackProject"] = round(grades.get("Hack/Project", 0), 1)
+            updates["grade_Research"] = round(grades.get("Research", 0), 1)
+            updates["grade_Startup"] = round(grades.get("Startup", 0), 1)
+
+            verification = grades.get("Verification", {})
+            updates["trust_score"] = verification.get("trust_score")
+
+            # Step 2e: Generate chart
+            safe_name = name.replace(" ", "_")
+            chart_path = os.path.join(self.output_dir, f"grade_{safe_name}.png")
+            plot_pentagram(grades, chart_path)
+            updates["chart_path"] = chart_path
+
+            updates["status"] = STATUS_DONE
+            updates["processed_at"] = processed_at
+            logger.info(
+                f"Done. Education={grades.get('Education')} "
+                f"Community={updates['grade_Community']} "
+                f"Hack={updates['grade_HackProject']} "
+                f"Research={updates['grade_Research']} "
+                f"Startup={updates['grade_Startup']} "
+                f"Trust={verification.get('trust_score')}"
+            )
+
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {e}"
+            logger.error(f"FAILED: {error_msg}")
+            logger.debug(traceback.format_exc())
+            updates["status"] = STATUS_FAILED
+            updates["error_message"] = error_msg
+            updates["processed_at"] = processed_at
+
+        finally:
+            # Release the log file descriptor; FileHandler reopens it if this logger is reused
+            logger.handlers[0].close()
+
+        return updates
@@ -0,0 +1,64 @@
+"""
+Playwright variant of visual_scraper.py.
+
+page.screenshot(full_page=True) handles lazy-loading, stitching and device-pixel-ratio
+itself over CDP, so this path needs no scroll loop or manual capture; the single
+screenshot is OCRed once and summarised with the same Ollama prompt.
+"""
+import io
+import logging
+import argparse
+
+from PIL import Image
+from playwright.sync_api import sync_playwright
+from tesserocr import PSM, PyTessBaseAPI
+
+from visual_scraper import process_image, summarize_ocr_text
+
+
+def capture_page(url: str, headless: bool) -> bytes:
+    """Open the URL in Chromium and return a full-page JPEG screenshot."""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        try:
+            page = browser.new_page(viewport={"width": 1280, "height": 800})
+            logging.info(f"Navigating to {url}")
+            page.goto(url, wait_until="networkidle")
+            logging.info("Capturing full page screenshot...")
+            return page.screenshot(full_page=True, type="jpeg", quality=85)
+        finally:
+            browser.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Visual LinkedIn Scraper (Playwright)")
+    parser.add_argument("--url", type=str, required=True, help="Profile URL")
+    parser.add_argument("--headless", action="store_true", help="Headless mode")
+
+    args = parser.parse_args()
+
+    target_url = args.url
+    if not target_url.startswith("http"):
+        target_url = "https://" + target_url
+
+    ocr_api = PyTessBaseAPI(lang="eng", psm=PSM.SINGLE_BLOCK)
+    try:
+        frame_data = capture_page(target_url, args.headless)
+        image = Image.open(io.BytesIO(frame_data))
+        image.load()
+
+        full_text = process_image(image, ocr_api) or ""
+
+        # Save raw text
+        with open("ocr_text.txt", "w") as f:
+            f.write(full_text)
+
+        if full_text:
+            summarize_ocr_text(full_text)
+
+    except Exception as e:
+        logging.exception(f"Error: {e}")
+    finally:
+        ocr_api.End()
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,73 @@ import argparse
 import json
 import os
 import sys
+import time
+import requests
 from verifier.parser import ResumeParser
 from verifier.engine import VerificationEngine
 from GitHubScraper import GitHubScraper
 
+# GitHub responses are cached per user between runs; past the TTL the cache is
+# revalidated with the profile ETag (304 responses don't count against the rate limit)
+GITHUB_CACHE_DIR = os.path.join("cache", "gh")
+GITHUB_CACHE_TTL = 24 * 60 * 60
+GITHUB_API_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "GitHub-Profile-Scraper",
+}
+
+
+def fetch_github_data(username):
+    """
+    Return {"profile": ..., "repositories": ...} for a GitHub user, or None if the user
+    does not exist. Served from cache/gh/<username>.json while fresh or unmodified.
+    """
+    cache_path = os.path.join(GITHUB_CACHE_DIR, f"{username.lower()}.json")
+    cached = None
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = None
+        if cached and time.time() - os.path.getmtime(cache_path) < GITHUB_CACHE_TTL:
+            return cached["data"]
+
+    # Only a stale entry with an ETag is worth a conditional request; on a plain miss the
+    # scraper's own profile fetch is the only request
+    if cached and cached.get("etag"):
+        headers = {**GITHUB_API_HEADERS, "If-None-Match": cached["etag"]}
+        try:
+            response = requests.get(f"https://api.github.com/users/{username}", headers=headers, timeout=10)
+        except requests.exceptions.RequestException:
+            response = None
+
+        if response is not None:
+            if response.status_code == 304:
+                # Profile unchanged: keep the cached repositories too, for another TTL
+                os.utime(cache_path)
+                return cached["data"]
+            if response.status_code == 404:
+                return None
+
+    scraper = GitHubScraper(username=username, save=False)
+    # The constructor has already fetched the profile and repositories
+    if not scraper.user_data:
+        return None
+    github_data = {
+        "profile": scraper.user_data,
+        "repositories": scraper.repositories,
+    }
+
+    os.makedirs(GITHUB_CACHE_DIR, exist_ok=True)
+    etag = scraper.etags.get(f"/users/{username}")
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"etag": etag, "data": github_data}, f)
+    os.replace(tmp_path, cache_path)
+    return github_data
+
+
 def main():
     parser = argparse.ArgumentParser(description="Resume HR Verifier - Cross-reference Resume with GitHub")
     parser.add_argument("--resume", required=True, help="Path to the Resume PDF file")
@@ -49,21 +112,11 @@ def main():
     # 4. Scrape GitHub Data
     print(f"🔍 Fetching GitHub data for user: {github_username}...")
     try:
-        scraper = GitHubScraper(username=github_username, save=False)
-        # We access the internal methods to get the raw data structure 
-        # normally scraper.get_json_output() returns a string, but we want the dict
-        # So we'll trigger the scraping and reconstruct the dict similarly to the scraper
-        profile = scraper.get_user_profile()
-        if not profile:
+        github_data = fetch_github_data(github_username)
+        if not github_data:
              print(f"❌ User '{github_username}' not found on GitHub.")
              return
 
-        repos = scraper.get_repositories()
-        
-        github_data = {
-            "profile": profile,
-            "repositories": repos
-        }
         print("✅ GitHub data fetched successfully.")
     except Exception as e:
         print(f"❌ Error fetching GitHub data: {e}")
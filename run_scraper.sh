@@ -62,14 +62,14 @@ case $choice in
             read -p "Enter LinkedIn profile URL: " URL
             echo ""
             echo "🔍 Scraping profile..."
-            python3 scraper.py --running True --port 9222 --host $WINDOWS_IP --url "$URL" --save True
+            python3 scraper.py --running --port 9222 --host $WINDOWS_IP --url "$URL" --save
         else
             echo "❌ Cannot connect to Chrome at $WINDOWS_IP:9222"
             echo ""
             echo "Troubleshooting:"
             echo "- Make sure Chrome is running with --remote-debugging-port=9222"
             echo "- Add firewall rule: New-NetFirewallRule -DisplayName 'Chrome Debug' -Direction Inbound -LocalPort 9222 -Protocol TCP -Action Allow"
-            echo "- Try manually: python3 scraper.py --running True --port 9222 --host $WINDOWS_IP --url YOUR_URL --save True"
+            echo "- Try manually: python3 scraper.py --running --port 9222 --host $WINDOWS_IP --url YOUR_URL --save"
             exit 1
         fi
         ;;
@@ -78,14 +78,14 @@ case $choice in
         read -p "Enter LinkedIn profile URL: " URL
         echo ""
         echo "🔍 Scraping profile in headless mode..."
-        python3 scraper.py --url "$URL" --save True --headless True
+        python3 scraper.py --url "$URL" --save --headless
         ;;
     3)
         echo ""
         read -p "Enter LinkedIn profile URL: " URL
         echo ""
         echo "🔍 Scraping profile with browser window..."
-        python3 scraper.py --url "$URL" --save True --headless False
+        python3 scraper.py --url "$URL" --save
         ;;
     *)
         echo "Invalid choice"
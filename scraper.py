@@ -1,10 +1,11 @@
 # Imports
-from bs4 import BeautifulSoup as bs
-
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
 import time
@@ -22,9 +23,46 @@ from GitHubScraper import GitHubScraper
 # Load environment variables from .env file
 load_dotenv()
 
+PAGE_LOAD_TIMEOUT = 15
+SCROLL_SCRIPT_TIMEOUT = 30
+
+# Runs the whole lazy-load scroll in the page: step down every `interval` ms and resolve
+# once the bottom is reached and scrollHeight has stopped growing for a few ticks
+SCROLL_TO_BOTTOM_JS = """
+const done = arguments[arguments.length - 1];
+const step = arguments[0], interval = arguments[1];
+let lastHeight = 0, stable = 0;
+(function tick() {
+    window.scrollBy(0, step);
+    const height = document.body.scrollHeight;
+    const atBottom = window.innerHeight + window.scrollY >= height;
+    if (atBottom && height === lastHeight) {
+        if (++stable > 3) {
+            window.scrollTo(0, 0);
+            return done(height);
+        }
+    } else {
+        stable = 0;
+    }
+    lastHeight = height;
+    setTimeout(tick, interval);
+})();
+"""
+
 
 # Functions and Classes
 
+# chromedriver binary resolved once per process (see _driver_path)
+_DRIVER_PATH = None
+
+
+def _driver_path() -> str:
+    """Path to chromedriver: $CHROMEDRIVER_PATH if set, else webdriver-manager's (resolved once)."""
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        _DRIVER_PATH = os.getenv("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+    return _DRIVER_PATH
+
 
 def quit_driver(driver):
     logging.critical("Quitting...")
@@ -58,7 +96,7 @@ def get_selenium_drivers(running: bool, **kwargs) -> webdriver.Chrome:
             driver = webdriver.Chrome(options=options)
         else:
             # Use webdriver-manager to automatically download and manage chromedriver
-            service = Service(ChromeDriverManager().install())
+            service = Service(_driver_path())
             driver = webdriver.Chrome(service=service, options=options)
     except Exception as e:
         logging.exception(e)
@@ -66,16 +104,30 @@ def get_selenium_drivers(running: bool, **kwargs) -> webdriver.Chrome:
         logging.critical("Make sure Chrome/Chromium is installed and chromedriver is in the correct location")
         raise RuntimeError("Failed to initialize Selenium driver")
 
-
-    logging.debug("waiting for the drivers to start...")
-    time.sleep(2)
     return driver
 
 
+def wait_for_page_load(driver: Any, timeout: int = PAGE_LOAD_TIMEOUT) -> None:
+    """Block until document.readyState is 'complete' (or the timeout expires)."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except TimeoutException:
+        logging.warning(f"Page did not finish loading within {timeout}s, continuing anyway")
+
+
 def sign_in(url: str, driver: object, username: str, password: str) -> None:
     logging.debug("Starting to load the page...")
     driver.get(url)
-    time.sleep(3)
+    try:
+        # Either the login form or the newer "Sign in with email" landing button
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(EC.any_of(
+            EC.presence_of_element_located((By.NAME, "session_key")),
+            EC.presence_of_element_located((By.XPATH, "//button[contains(text(), 'Sign in with email')]")),
+        ))
+    except TimeoutException:
+        logging.debug("Login form not detected, continuing...")
     logging.debug("Page loaded...")
 
     logging.debug("signing in...")
@@ -87,7 +139,9 @@ def sign_in(url: str, driver: object, username: str, password: str) -> None:
             email_signin_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Sign in with email')]")
             logging.debug("Found 'Sign in with email' button, clicking it...")
             email_signin_btn.click()
-            time.sleep(2)
+            WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+                EC.presence_of_element_located((By.NAME, "session_key"))
+            )
         except:
             logging.debug("No 'Sign in with email' button found, proceeding to direct login...")
             pass
@@ -120,8 +174,10 @@ def sign_in(url: str, driver: object, username: str, password: str) -> None:
             except:
                 btn = driver.find_element(By.XPATH, "//button[contains(@class, 'sign-in-form__submit-button')]")
         
+        login_url = driver.current_url
         btn.click()
-        time.sleep(10)
+        # Successful login navigates away from the login page (to the feed or a checkpoint)
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(EC.url_changes(login_url))
         print("✅ Signed in successfully!")
         logging.info("Successfully signed in to LinkedIn")
         
@@ -186,7 +242,6 @@ def extract_profile_information(url: str, driver: object, save: bool, platform:
         ### PROFILE ACQUIRED ###
 
         ### EXTRACTING INFORMATION ###
-        time.sleep(2)
         extractor = LinkedinScraper(page_source, driver, save)
 
         if save:
@@ -200,30 +255,16 @@ def extract_profile_information(url: str, driver: object, save: bool, platform:
 def scroll_to_bottom(driver: Any) -> None:
     """Scroll to bottom of page to load all dynamic content"""
     logging.debug("Scrolling to load all sections...")
-    
-    # Get initial page height
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    
-    # Scroll in increments to trigger lazy loading
-    scroll_pause_time = 1.5
-    scroll_increment = 800
-    
-    current_position = 0
-    while current_position < last_height:
-        # Scroll down by increment
-        current_position += scroll_increment
-        driver.execute_script(f"window.scrollTo(0, {current_position});")
-        time.sleep(scroll_pause_time)
-        
-        # Calculate new scroll height and compare with last scroll height
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height > last_height:
-            last_height = new_height
-    
-    # Scroll back to top
-    driver.execute_script("window.scrollTo(0, 0);")
-    time.sleep(1)
-    logging.debug("Scrolling complete")
+
+    # A single async script round-trip instead of one scroll + height query per increment
+    driver.set_script_timeout(SCROLL_SCRIPT_TIMEOUT)
+    try:
+        height = driver.execute_async_script(SCROLL_TO_BOTTOM_JS, 800, 200)
+        logging.debug(f"Scrolling complete (page height {height})")
+    except TimeoutException:
+        # Page kept growing (infinite feed); keep whatever has loaded so far
+        driver.execute_script("window.scrollTo(0, 0);")
+        logging.warning(f"Scrolling did not settle within {SCROLL_SCRIPT_TIMEOUT}s")
 
 
 def get_profile(driver: Any, url: str) -> str:
@@ -231,7 +272,7 @@ def get_profile(driver: Any, url: str) -> str:
         logging.debug("getting profile...")
 
         driver.get(url)
-        time.sleep(5)  # Increased from 3 to 5 seconds
+        wait_for_page_load(driver)
 
         logging.debug("profile loaded...")
     else:
@@ -240,9 +281,6 @@ def get_profile(driver: Any, url: str) -> str:
     # Scroll to load all dynamic sections
     scroll_to_bottom(driver)
     
-    # Wait a bit more after scrolling
-    time.sleep(2)
-    
     profile = driver.page_source
     return profile
 
@@ -274,9 +312,8 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--running",
-        type=bool,
+        action="store_true",
         help="Take control of the already running chrome instance in debug mode (for LinkedIn or GitHub contribution scraping)",
-        default=False,
     )
     parser.add_argument(
         "--port",
@@ -292,21 +329,18 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--save",
-        type=bool,
+        action="store_true",
         help="Save the output in a json file",
-        default=False,
     )
     parser.add_argument(
         "--debug",
-        type=bool,
+        action="store_true",
         help="Debug mode",
-        default=False,
     )
     parser.add_argument(
         "--headless",
-        type=bool,
+        action="store_true",
         help="Run Chrome in headless mode (no GUI)",
-        default=False,
     )
 
     args = parser.parse_args()
@@ -336,7 +370,7 @@ if __name__ == "__main__":
 
         # If user wants contribution graph, they need a driver
         if args.save:
-            print("Note: To scrape contribution graphs, use --running True with a browser")
+            print("Note: To scrape contribution graphs, use --running with a browser")
 
     elif not args.running:
         # LinkedIn mode - requires login
@@ -30,7 +30,7 @@ echo "Running scraper..."
 echo ""
 
 # Run the scraper
-python3 scraper.py --running True --port 9222 --url "$TEST_URL" --save True --debug True
+python3 scraper.py --running --port 9222 --url "$TEST_URL" --save --debug
 
 # Check results
 if [ $? -eq 0 ]; then
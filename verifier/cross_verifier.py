@@ -1,6 +1,19 @@
 import re
-from typing import Dict, List, Any
-from fuzzywuzzy import fuzz
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+import ahocorasick
+from rapidfuzz import fuzz, process, utils
+
+
+# (matches, discrepancies, trust score delta) produced by each _check_* method
+CheckResult = Tuple[List[str], List[str], int]
+
+
+def _norm(text: str) -> str:
+    """Lowercase and strip punctuation once, so fuzzy scorers can run with processor=None."""
+    return utils.default_process(text) if text else ""
+
 
 class CrossVerifier:
     def __init__(self, form_data: Dict, linkedin_data: Dict, resume_data: Dict):
@@ -10,12 +23,33 @@ class CrossVerifier:
         self.discrepancies = []
         self.matches = []
         self.trust_score = 100
+        self._li_experiences = self.linkedin.get("experience", [])
+
+        # Normalized copies of every string the checks compare, computed once
+        self._form_school_norm = _norm(self.form.get("education_school"))
+        self._form_startup_norm = _norm(self.form.get("startup_name"))
+        self._form_role_norm = _norm(self.form.get("current_role"))
+        self._li_schools_norm = [_norm(edu.get("school", "")) for edu in self.linkedin.get("education", [])]
+        self._li_companies_norm = [_norm(exp.get("company", "")) for exp in self._li_experiences]
+        self._li_titles_norm = [_norm(exp.get("title", "")) for exp in self._li_experiences]
+        self._res_education_norm = [_norm(s) for s in self.resume.get("education", [])]
+
+        # Lowercased form claims that occur verbatim in the resume text
+        self._res_text_lower = self.resume.get("raw_text_lower") or self.resume.get("raw_text", "").lower()
+        self._res_text_hits = self._scan_resume_text()
 
     def verify(self) -> Dict[str, Any]:
         """Run all verification checks and return report."""
-        self._check_education()
-        self._check_experience()
-        self._check_projects()
+        # The checks only read instance state, and rapidfuzz releases the GIL while scoring,
+        # so they run side by side; results are merged in the original check order
+        checks = (self._check_education, self._check_experience, self._check_projects)
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = [pool.submit(check) for check in checks]
+            for future in futures:
+                matches, discrepancies, score_delta = future.result()
+                self.matches.extend(matches)
+                self.discrepancies.extend(discrepancies)
+                self.trust_score += score_delta
         
         # Calculate final score
         # Start at 100, deduct for discrepancies, add (internal) weight for matches
@@ -37,89 +71,129 @@ class CrossVerifier:
         else:
             return "Significant discrepancies found. Important claims not verified in external sources."
 
+    def _scan_resume_text(self) -> set:
+        """Find every form claim in the resume text with one Aho-Corasick pass."""
+        patterns = {
+            claim.lower()
+            for claim in (self.form.get("education_school"), self.form.get("startup_name"))
+            if claim
+        }
+        if not patterns or not self._res_text_lower:
+            return set()
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return {pattern for _, pattern in automaton.iter(self._res_text_lower)}
+
     def _fuzzy_match(self, str1: str, str2: str, threshold: int = 80) -> bool:
+        """Token-sort match of two strings already normalized with _norm."""
         if not str1 or not str2:
             return False
-        return fuzz.token_sort_ratio(str1.lower(), str2.lower()) >= threshold
+        if self._trivial_match(str1, str2):
+            return True
+        return self._score(str1, str2, threshold) >= threshold
+
+    def _best_match(self, query: str, choices: List[str], threshold: int = 80) -> Optional[int]:
+        """Index of the normalized choice that best matches query, or None if none reaches threshold."""
+        if not query:
+            return None
+        for i, choice in enumerate(choices):
+            if choice and self._trivial_match(query, choice):
+                return i
+        best = process.extractOne(query, choices, scorer=fuzz.token_sort_ratio, processor=None, score_cutoff=threshold)
+        return best[2] if best else None
+
+    @staticmethod
+    def _trivial_match(str1: str, str2: str) -> bool:
+        """
+        Fast path: identical, same tokens in another order, or one contained in the other
+        on word boundaries ("stanford" / "stanford university") all count as a match.
+        """
+        if str1 == str2 or frozenset(str1.split()) == frozenset(str2.split()):
+            return True
+        return f" {str1} " in f" {str2} " or f" {str2} " in f" {str1} "
 
-    def _check_education(self):
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _score(str1: str, str2: str, score_cutoff: int) -> float:
+        """Memoized token_sort_ratio; the same school/company pairs recur across checks and candidates."""
+        # score_cutoff lets rapidfuzz bail out early on pairs that can't reach the threshold
+        return fuzz.token_sort_ratio(str1, str2, processor=None, score_cutoff=score_cutoff)
+
+    def _check_education(self) -> CheckResult:
         """Verify education claims."""
+        matches, discrepancies, score_delta = [], [], 0
         form_school = self.form.get("education_school")
         if not form_school:
-            return
+            return matches, discrepancies, score_delta
 
         # Check LinkedIn
-        li_schools = [edu.get("school", "") for edu in self.linkedin.get("education", [])]
-        li_match = any(self._fuzzy_match(form_school, s) for s in li_schools)
+        li_match = any(self._fuzzy_match(self._form_school_norm, s) for s in self._li_schools_norm)
 
         # Check Resume
-        res_text = self.resume.get("raw_text", "")
         # Heuristic: School name should appear in resume text
-        res_match = form_school.lower() in res_text.lower() or \
-                    any(self._fuzzy_match(form_school, s) for s in self.resume.get("education", []))
+        res_match = form_school.lower() in self._res_text_hits or \
+                    any(self._fuzzy_match(self._form_school_norm, s) for s in self._res_education_norm)
 
         if li_match and res_match:
-            self.matches.append(f"Education '{form_school}' verified on LinkedIn and Resume.")
+            matches.append(f"Education '{form_school}' verified on LinkedIn and Resume.")
         elif li_match:
-             self.matches.append(f"Education '{form_school}' verified on LinkedIn.")
+             matches.append(f"Education '{form_school}' verified on LinkedIn.")
         elif res_match:
-             self.matches.append(f"Education '{form_school}' verified on Resume.")
+             matches.append(f"Education '{form_school}' verified on Resume.")
         else:
-            self.discrepancies.append(f"CRITICAL: Education '{form_school}' claimed in form but NOT found in LinkedIn or Resume.")
-            self.trust_score -= 20
+            discrepancies.append(f"CRITICAL: Education '{form_school}' claimed in form but NOT found in LinkedIn or Resume.")
+            score_delta -= 20
+        return matches, discrepancies, score_delta
 
-    def _check_experience(self):
+    def _check_experience(self) -> CheckResult:
         """Verify current role/startup."""
+        matches, discrepancies, score_delta = [], [], 0
         current_role = self.form.get("current_role")
         startup_name = self.form.get("startup_name")
         
         if not startup_name:
-            return
+            return matches, discrepancies, score_delta
 
-        # Check LinkedIn Experience
-        li_experiences = self.linkedin.get("experience", [])
-        
-        # 1. Check if startup name exists in LI
-        found_company = False
-        for exp in li_experiences:
-            company = exp.get("company", "")
-            if self._fuzzy_match(startup_name, company):
-                found_company = True
-                # Check role if company found
-                role = exp.get("title", "")
-                if current_role and self._fuzzy_match(current_role, role):
-                     self.matches.append(f"Role '{current_role}' at '{startup_name}' verified on LinkedIn.")
-                elif current_role:
-                     self.matches.append(f"Company '{startup_name}' verified on LinkedIn, but role '{current_role}' mismatch (Found: {role}).")
-                     self.trust_score -= 5 # Minor deduction for title mismatch
-                break
+        # 1. Check if startup name exists in LinkedIn experience
+        i = self._best_match(self._form_startup_norm, self._li_companies_norm)
+        found_company = i is not None
+        if found_company:
+            # Check role if company found
+            role = self._li_experiences[i].get("title", "")
+            if current_role and self._fuzzy_match(self._form_role_norm, self._li_titles_norm[i]):
+                 matches.append(f"Role '{current_role}' at '{startup_name}' verified on LinkedIn.")
+            elif current_role:
+                 matches.append(f"Company '{startup_name}' verified on LinkedIn, but role '{current_role}' mismatch (Found: {role}).")
+                 score_delta -= 5 # Minor deduction for title mismatch
         
         if not found_company:
             # Check Resume
-            res_text = self.resume.get("raw_text", "").lower()
-            if startup_name.lower() in res_text:
-                self.matches.append(f"Startup '{startup_name}' found in Resume (but not LinkedIn).")
+            if startup_name.lower() in self._res_text_hits:
+                matches.append(f"Startup '{startup_name}' found in Resume (but not LinkedIn).")
             else:
-                self.discrepancies.append(f"WARNING: Startup '{startup_name}' not found in LinkedIn experience OR Resume.")
-                self.trust_score -= 15
+                discrepancies.append(f"WARNING: Startup '{startup_name}' not found in LinkedIn experience OR Resume.")
+                score_delta -= 15
+        return matches, discrepancies, score_delta
 
     def get_employer_locations(self) -> list:
         """Return list of location strings from LinkedIn experience entries."""
         return [
             exp.get("location", "")
-            for exp in self.linkedin.get("experience", [])
+            for exp in self._li_experiences
             if exp.get("location")
         ]
 
-    def _check_projects(self):
+    def _check_projects(self) -> CheckResult:
         """Check if 'built' things appear in GitHub or Resume."""
+        matches, discrepancies, score_delta = [], [], 0
         projects_text = self.form.get("projects", "")
         if len(projects_text) < 10: 
-            return
-        
-        res_text = self.resume.get("raw_text", "").lower()
+            return matches, discrepancies, score_delta
         
         # Fallback to simple trust deduction if major project claimed but Resume is empty/sparse
-        if len(res_text) < 200 and len(projects_text) > 200:
-             self.discrepancies.append("Detailed projects in form but Resume is very sparse.")
-             self.trust_score -= 10
+        if len(self._res_text_lower) < 200 and len(projects_text) > 200:
+             discrepancies.append("Detailed projects in form but Resume is very sparse.")
+             score_delta -= 10
+        return matches, discrepancies, score_delta
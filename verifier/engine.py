@@ -1,7 +1,15 @@
 from typing import Dict, Any, List, Optional
-from fuzzywuzzy import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process, utils
 
 
+# Weight of each check category in the overall score (unlisted categories weigh 1)
+CATEGORY_WEIGHTS = {
+    "Identity": 2.0,
+    # Website checks are supplementary — half weight
+    "Website": 0.5,
+}
+
 class VerificationEngine:
     def __init__(
         self,
@@ -12,6 +20,8 @@ class VerificationEngine:
         self.resume = resume_data
         self.github = github_data
         self.website = website_data or {}
+        # Joined and lowercased once; company checks scan it with partial_ratio
+        self._experience_text_lower = " ".join(self.resume.get("experience", [])).lower()
         self.report = {
             "score": 0,
             "checks": [],
@@ -32,7 +42,8 @@ class VerificationEngine:
         resume_name = self.resume.get("name", "")
         github_name = self.github.get("profile", {}).get("name", "")
 
-        match_score = fuzz.token_sort_ratio(resume_name, github_name)
+        # rapidfuzz returns floats and doesn't preprocess by default; keep fuzzywuzzy's integer scores
+        match_score = round(fuzz.token_sort_ratio(resume_name, github_name, processor=utils.default_process))
         status = "PASS" if match_score > 80 else "WARN" if match_score > 50 else "FAIL"
 
         self.report["checks"].append({
@@ -51,9 +62,8 @@ class VerificationEngine:
             return
 
         clean_gh_company = github_company.replace("@", "").strip()
-        experience_text = " ".join(self.resume.get("experience", []))
 
-        match_score = fuzz.partial_ratio(clean_gh_company.lower(), experience_text.lower())
+        match_score = round(fuzz.partial_ratio(clean_gh_company.lower(), self._experience_text_lower, processor=None))
         status = "PASS" if match_score > 80 else "WARN"
 
         self.report["checks"].append({
@@ -79,24 +89,30 @@ class VerificationEngine:
             if repo.get("language"):
                 github_skills.add(repo.get("language").lower())
 
-        matched_skills = []
-        unverified_skills = []
-
+        # Deduplicate case-insensitively (first spelling wins), dropping empty entries;
+        # github_skills is already lowercase, so the resume side is lowercased once here
+        unique_skills = {}
         for skill in flat_resume_skills:
-            if not skill:
-                continue
-            skill_lower = skill.lower()
-            found = False
-            for gh_skill in github_skills:
-                if fuzz.ratio(skill_lower, gh_skill) > 85:
-                    matched_skills.append(skill)
-                    found = True
-                    break
-            if not found:
-                unverified_skills.append(skill)
-
-        if flat_resume_skills:
-            verification_rate = len(matched_skills) / len(flat_resume_skills) * 100
+            if skill:
+                unique_skills.setdefault(skill.lower(), skill)
+        skills = np.array(list(unique_skills.values()), dtype=object)
+        skills_lower = list(unique_skills)
+
+        matched_mask = np.fromiter((s in github_skills for s in skills_lower), dtype=bool, count=len(skills))
+        fuzzy_idx = np.flatnonzero(~matched_mask)
+        if fuzzy_idx.size and github_skills:
+            # Exact hits are a set lookup above; the rest are scored against every GitHub
+            # language in one call (uint8 rounds scores to integers like fuzzywuzzy did)
+            scores = process.cdist(
+                [skills_lower[i] for i in fuzzy_idx], list(github_skills), scorer=fuzz.ratio, processor=None,
+                score_cutoff=85, dtype=np.uint8, workers=-1,
+            )
+            matched_mask[fuzzy_idx] = scores.max(axis=1) > 85
+        matched_skills = skills[matched_mask].tolist()
+        unverified_skills = skills[~matched_mask].tolist()
+
+        if len(skills):
+            verification_rate = len(matched_skills) / len(skills) * 100
             status = "PASS" if verification_rate > 50 else "WARN"
         else:
             verification_rate = 0
@@ -105,7 +121,7 @@ class VerificationEngine:
         self.report["checks"].append({
             "category": "Skills",
             "item": "Skill Verification",
-            "resume_value": f"{len(flat_resume_skills)} skills listed",
+            "resume_value": f"{len(skills)} skills listed",
             "github_value": f"{len(github_skills)} languages found",
             "match_score": int(verification_rate),
             "status": status,
@@ -122,7 +138,9 @@ class VerificationEngine:
 
         # Name check
         if resume_name and website_name:
-            match_score = fuzz.token_sort_ratio(resume_name.lower(), website_name.lower())
+            match_score = round(
+                fuzz.token_sort_ratio(resume_name, website_name, processor=utils.default_process)
+            )
             status = "PASS" if match_score > 75 else "WARN"
             self.report["checks"].append({
                 "category": "Website",
@@ -138,7 +156,7 @@ class VerificationEngine:
         if github_company:
             clean_company = github_company.replace("@", "").strip()
             companies_text = " ".join(self.website.get("companies", []))
-            match_score = fuzz.partial_ratio(clean_company.lower(), companies_text.lower())
+            match_score = round(fuzz.partial_ratio(clean_company.lower(), companies_text.lower()))
             self.report["checks"].append({
                 "category": "Website",
                 "item": "Company Mention",
@@ -150,21 +168,14 @@ class VerificationEngine:
 
     def _calculate_score(self):
         """Calculate overall trust score."""
-        total_score = 0
-        count = 0
-        for check in self.report["checks"]:
-            if check["category"] == "Identity":
-                total_score += check["match_score"] * 2
-                count += 2
-            elif check["category"] == "Website":
-                # Website checks are supplementary — half weight
-                total_score += check["match_score"] * 0.5
-                count += 0.5
-            else:
-                total_score += check["match_score"]
-                count += 1
-
-        self.report["score"] = int(total_score / count) if count > 0 else 0
+        checks = self.report["checks"]
+        scores = np.fromiter((check["match_score"] for check in checks), dtype=np.float64, count=len(checks))
+        weights = np.fromiter(
+            (CATEGORY_WEIGHTS.get(check["category"], 1.0) for check in checks),
+            dtype=np.float64, count=len(checks),
+        )
+
+        self.report["score"] = int(scores @ weights / weights.sum()) if len(checks) else 0
 
         if self.report["score"] > 80:
             self.report["summary"] = "High Trust: Resume aligns well with public GitHub profile."
@@ -1,7 +1,87 @@
 import re
 from typing import Dict, List, Any, Optional
+import ahocorasick
 from pypdf import PdfReader
 
+# Compiled once at import instead of on every parse
+_GH_RE = re.compile(r'github\.com/([a-zA-Z0-9_\-]+)', re.IGNORECASE)
+_LI_RE = re.compile(r'linkedin\.com/in/([a-zA-Z0-9_\-]+)', re.IGNORECASE)
+# Personal website: any http(s) URL that is not github/linkedin/twitter/facebook/scholar
+_WEB_RE = re.compile(
+    r'https?://(?!(?:www\.)?(?:github|linkedin|twitter|facebook|scholar\.google|researchgate|orcid|doi|arxiv))'
+    r'[a-zA-Z0-9\-\.]+\.[a-z]{2,}(?:/[^\s]*)?',
+    re.IGNORECASE
+)
+# Two+ capitalized words (accents allowed), nothing else on the line
+_NAME_RE = re.compile(
+    r'^[A-Z\u00C0-\u017E][a-z\u00C0-\u017E\-]+'
+    r'( [A-Z\u00C0-\u017E][a-z\u00C0-\u017E\-]+)+'
+    r'$'
+)
+_DIGIT_RE = re.compile(r'\d')
+
+# Header keywords for each extracted section
+SECTION_KEYWORDS = {
+    "skills": [
+        "skills", "technologies", "competencies",
+        "compétences", "fähigkeiten", "habilidades",
+        "technical skills", "core competencies", "tech stack",
+        "outils", "langages", "langages de programmation"
+    ],
+    "experience": [
+        "experience", "employment", "work history",
+        "professional experience", "work experience",
+        "expérience", "expérience professionnelle",
+        "berufserfahrung", "experiencia", "parcours professionnel"
+    ],
+    "education": [
+        "education", "academic", "academic background",
+        "formation", "études", "diplômes",
+        "ausbildung", "educación", "degrees", "qualifications"
+    ],
+}
+
+# All known section stop-words (expanded to include multilingual variants)
+STOP_WORDS = [
+    "education", "experience", "skills", "projects", "languages",
+    "volunteering", "certifications", "publications", "awards", "honors",
+    "formation", "expérience", "compétences", "projets", "langues",
+    "ausbildung", "berufserfahrung", "fähigkeiten", "projekte",
+    "educación", "experiencia", "habilidades", "proyectos", "idiomas",
+    "interests", "hobbies", "references", "summary", "objective",
+    "profil", "résumé", "about"
+]
+
+
+# Plain pdfplumber output with fewer lines than this per page is treated as garbled
+# (e.g. columns run together) and re-extracted with layout=True
+MIN_LINES_PER_PAGE = 5
+
+_STOP_SET = frozenset(STOP_WORDS)
+_KEYWORD_SETS = {name: frozenset(keywords) for name, keywords in SECTION_KEYWORDS.items()}
+
+
+def _build_header_automaton() -> "ahocorasick.Automaton":
+    """Aho-Corasick automaton over every header keyword and stop-word, each tagged with
+    the sections it opens, so one scan of a line finds all of them."""
+    sections_by_word = {}
+    for name, keywords in SECTION_KEYWORDS.items():
+        for keyword in keywords:
+            sections_by_word.setdefault(keyword, set()).add(name)
+    for word in STOP_WORDS:
+        sections_by_word.setdefault(word, set())
+
+    automaton = ahocorasick.Automaton()
+    for word, sections in sections_by_word.items():
+        automaton.add_word(word, (word, frozenset(sections)))
+    automaton.make_automaton()
+    return automaton
+
+
+# Per section: a line containing one of its keywords opens it, one containing another
+# section's stop-word closes it
+_HEADER_AC = _build_header_automaton()
+
 
 class ResumeParser:
     def __init__(self, pdf_path: str):
@@ -14,17 +94,15 @@ class ResumeParser:
         }
 
     def extract_text(self) -> str:
-        """Extract text from the PDF file. Tries pdfplumber first (layout-aware), falls back to pypdf."""
-        # Primary: pdfplumber (handles two-column layouts, tables)
+        """Extract text from the PDF file. Tries pdfplumber first, falls back to pypdf."""
+        # Primary: pdfplumber (handles two-column layouts, tables). Plain extraction is much
+        # cheaper than layout=True, which is only used when the plain text looks garbled
         try:
             import pdfplumber
             with pdfplumber.open(self.pdf_path) as pdf:
-                pages = []
-                for page in pdf.pages:
-                    text = page.extract_text(layout=True)
-                    if text:
-                        pages.append(text)
-                result = "\n".join(pages)
+                result = self._pdfplumber_text(pdf, layout=False)
+                if result.count("\n") + 1 < MIN_LINES_PER_PAGE * len(pdf.pages):
+                    result = self._pdfplumber_text(pdf, layout=True) or result
                 if result.strip():
                     self.text = result
                     return self.text
@@ -34,29 +112,37 @@ class ResumeParser:
         # Fallback: pypdf
         try:
             reader = PdfReader(self.pdf_path)
-            text = ""
+            pages = []
             for page in reader.pages:
-                text += page.extract_text() + "\n"
-            self.text = text
-            return text
+                text = page.extract_text()
+                if text:
+                    pages.append(text)
+            self.text = "\n".join(pages)
+            return self.text
         except Exception as e:
             print(f"[Parser] Error reading PDF: {e}")
             return ""
 
+    @staticmethod
+    def _pdfplumber_text(pdf, layout: bool) -> str:
+        """Join the text of every page, releasing each page's parsed objects once read."""
+        pages = []
+        for page in pdf.pages:
+            text = page.extract_text(layout=layout)
+            page.close()
+            if text:
+                pages.append(text)
+        return "\n".join(pages)
+
     def _extract_name_from_top(self, lines: List[str]) -> Optional[str]:
         """Scan first 10 lines for a name pattern (two+ capitalized words, no digits, under 50 chars)."""
-        name_pattern = re.compile(
-            r'^[A-Z\u00C0-\u017E][a-z\u00C0-\u017E\-]+'
-            r'( [A-Z\u00C0-\u017E][a-z\u00C0-\u017E\-]+)+'
-            r'$'
-        )
         for line in lines[:10]:
             clean = line.strip()
             if not clean or len(clean) > 50:
                 continue
-            if re.search(r'\d', clean):
+            if _DIGIT_RE.search(clean):
                 continue
-            if name_pattern.match(clean):
+            if _NAME_RE.match(clean):
                 return clean
         return None
 
@@ -77,28 +163,8 @@ class ResumeParser:
                     break
         name = name or ""
 
-        # 2. Extract Skills
-        self._extract_section("skills", [
-            "skills", "technologies", "competencies",
-            "compétences", "fähigkeiten", "habilidades",
-            "technical skills", "core competencies", "tech stack",
-            "outils", "langages", "langages de programmation"
-        ])
-
-        # 3. Extract Experience
-        self._extract_section("experience", [
-            "experience", "employment", "work history",
-            "professional experience", "work experience",
-            "expérience", "expérience professionnelle",
-            "berufserfahrung", "experiencia", "parcours professionnel"
-        ])
-
-        # 4. Extract Education
-        self._extract_section("education", [
-            "education", "academic", "academic background",
-            "formation", "études", "diplômes",
-            "ausbildung", "educación", "degrees", "qualifications"
-        ])
+        # 2-4. Extract Skills, Experience and Education
+        self._extract_sections(lines)
 
         return {
             "name": name,
@@ -106,63 +172,54 @@ class ResumeParser:
             "experience": self.sections["experience"],
             "education": self.sections["education"],
             "links": self.extract_links(),
-            "raw_text": self.text
+            "raw_text": self.text,
+            # Lowercased once here so verifiers don't each lowercase the full text again
+            "raw_text_lower": self.text.lower()
         }
 
     def extract_links(self) -> Dict[str, Optional[str]]:
         """Extract GitHub, LinkedIn, and personal website URLs."""
         links: Dict[str, Optional[str]] = {"github": None, "linkedin": None, "website": None}
 
-        gh_match = re.search(r'github\.com/([a-zA-Z0-9_\-]+)', self.text, re.IGNORECASE)
+        gh_match = _GH_RE.search(self.text)
         if gh_match:
             links["github"] = gh_match.group(1)
 
-        li_match = re.search(r'linkedin\.com/in/([a-zA-Z0-9_\-]+)', self.text, re.IGNORECASE)
+        li_match = _LI_RE.search(self.text)
         if li_match:
             links["linkedin"] = li_match.group(1)
 
-        # Personal website: any http(s) URL that is not github/linkedin/twitter/facebook/scholar
-        web_match = re.search(
-            r'https?://(?!(?:www\.)?(?:github|linkedin|twitter|facebook|scholar\.google|researchgate|orcid|doi|arxiv))'
-            r'[a-zA-Z0-9\-\.]+\.[a-z]{2,}(?:/[^\s]*)?',
-            self.text,
-            re.IGNORECASE
-        )
+        web_match = _WEB_RE.search(self.text)
         if web_match:
             links["website"] = web_match.group(0).rstrip('.,;)')
 
         return links
 
-    def _extract_section(self, section_name: str, keywords: List[str]):
-        """Helper to extract a section based on keywords."""
-        lines = self.text.split('\n')
-        in_section = False
-        captured_lines = []
-
-        # All known section stop-words (expanded to include multilingual variants)
-        stop_words = [
-            "education", "experience", "skills", "projects", "languages",
-            "volunteering", "certifications", "publications", "awards", "honors",
-            "formation", "expérience", "compétences", "projets", "langues",
-            "ausbildung", "berufserfahrung", "fähigkeiten", "projekte",
-            "educación", "experiencia", "habilidades", "proyectos", "idiomas",
-            "interests", "hobbies", "references", "summary", "objective",
-            "profil", "résumé", "about"
-        ]
+    def _extract_sections(self, lines: List[str]):
+        """Route lines into every section in a single pass over the text."""
+        captured = {name: [] for name in SECTION_KEYWORDS}
+        in_section = dict.fromkeys(SECTION_KEYWORDS, False)
 
         for line in lines:
-            clean_line = line.strip().lower()
-
-            is_header = any(keyword in clean_line for keyword in keywords) and len(clean_line) < 40
-
-            if is_header:
-                in_section = True
-                continue
-
-            if in_section and any(h in clean_line for h in stop_words if h not in keywords) and len(clean_line) < 40:
-                in_section = False
-
-            if in_section and line.strip():
-                captured_lines.append(line.strip())
-
-        self.sections[section_name] = captured_lines
+            stripped = line.strip()
+            clean_line = stripped.lower()
+            headers, stop_hits = set(), set()
+            # Longer lines are content, never headers or stop-words
+            if len(clean_line) < 40:
+                for _, (word, sections) in _HEADER_AC.iter(clean_line):
+                    headers |= sections
+                    if word in _STOP_SET:
+                        stop_hits.add(word)
+
+            for name in SECTION_KEYWORDS:
+                if name in headers:
+                    in_section[name] = True
+                    continue
+
+                if in_section[name] and stop_hits - _KEYWORD_SETS[name]:
+                    in_section[name] = False
+
+                if in_section[name] and stripped:
+                    captured[name].append(stripped)
+
+        self.sections.update(captured)
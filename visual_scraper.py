@@ -1,19 +1,62 @@
 import time
 import logging
 import argparse
-import os
 import io
 import json
+import queue
+import threading
 from base64 import b64decode
+from typing import Optional
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
+import cv2
+import numpy as np
+import xxhash
 from PIL import Image
-import pytesseract
+from tesserocr import PSM, PyTessBaseAPI
 
 from ollama_wrapper import OllamaClient
+from website_scraper import WebsiteScraper
+
+# Chrome can't rasterise a single capture much taller than its max texture size (16384px);
+# longer pages are OCRed a viewport at a time instead
+MAX_SINGLE_CAPTURE_HEIGHT = 16384
+
+# Captures at least this wide are halved before OCR
+OCR_DOWNSCALE_MIN_WIDTH = 1024
+
+# A plain GET returning at least this much visible text means the page renders server-side
+# and doesn't need a browser at all
+STATIC_TEXT_THRESHOLD = 2000
+
+# Height of the bottom strip fingerprinted to spot a rolling frame that repeats the previous one
+FRAME_HASH_STRIP = 200
+
+# JPEG decodes several times faster than PNG and body text OCRs fine at this quality
+CAPTURE_FORMAT = {"format": "jpeg", "quality": 85}
+
+# Checks whether the viewport already reaches the bottom and, if not, scrolls by arguments[0]px;
+# returns [scrollHeight, innerHeight, atBottom] so callers need a single round-trip per step
+SCROLL_STEP_JS = """
+// 1px slack: scrollY can be fractional on zoomed/high-DPI pages
+const atBottom = window.innerHeight + window.scrollY >= document.body.scrollHeight - 1;
+if (!atBottom) window.scrollBy(0, arguments[0]);
+return [document.body.scrollHeight, window.innerHeight, atBottom];
+"""
+
+# Resolves after the next two animation frames (i.e. the scrolled content has been painted)
+# once the document is loaded; gives up after a second so throttled tabs don't stall
+RENDER_READY_JS = """
+const done = arguments[arguments.length - 1];
+setTimeout(() => done(false), 1000);
+function painted() { requestAnimationFrame(() => requestAnimationFrame(() => done(true))); }
+if (document.readyState === 'complete') painted();
+else window.addEventListener('load', painted, {once: true});
+"""
 
 # Configure logging
 logging.basicConfig(
@@ -66,18 +109,15 @@ def scroll_to_bottom(driver) -> None:
     """Scroll to bottom of page to load all dynamic content"""
     logging.info("Scrolling to load all sections...")
     
-    last_height = driver.execute_script("return document.body.scrollHeight")
     scroll_pause_time = 1.5
     scroll_increment = 800
     
-    current_position = 0
-    while current_position < last_height:
-        current_position += scroll_increment
-        driver.execute_script(f"window.scrollTo(0, {current_position});")
+    # One round-trip per step: the bottom check sees whatever loaded during the last pause
+    while True:
+        _, _, at_bottom = driver.execute_script(SCROLL_STEP_JS, scroll_increment)
+        if at_bottom:
+            break
         time.sleep(scroll_pause_time)
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height > last_height:
-            last_height = new_height
     
     # Scroll back to top for screenshot? 
     # Actually, for a long page, we might want to take multiple screenshots or a full page one.
@@ -136,16 +176,15 @@ def capture_full_page(driver) -> Image.Image:
     stitch_image = Image.new('RGB', (total_width, total_height))
     
     previous = None
-    part = 0
     
     for rectangle in rectangles:
         if previous is not None:
             driver.execute_script(f"window.scrollTo({rectangle[0]}, {rectangle[1]})")
             time.sleep(0.5) # Wait for render
             
-        file_name = f"part_{part}.png"
-        driver.get_screenshot_as_file(file_name)
-        screenshot = Image.open(file_name)
+        # Decode the tile straight from memory instead of a part_N.png round-trip
+        screenshot = Image.open(io.BytesIO(driver.get_screenshot_as_png()))
+        screenshot.load()
         
         if rectangle[1] + viewport_height > total_height:
             offset = (0, total_height - viewport_height)
@@ -160,23 +199,192 @@ def capture_full_page(driver) -> Image.Image:
         # Ideally, we crop the scrollbar out too.
         
         stitch_image.paste(screenshot, (rectangle[0], rectangle[1]))
-        os.remove(file_name)
-        part += 1
         previous = rectangle
         
     return stitch_image
 
-def process_image(image_path: str):
-    logging.info(f"Processing image for OCR: {image_path}")
+def binarize(image: Image.Image) -> Image.Image:
+    """Grayscale + Otsu threshold: Tesseract segments clean black-on-white text much faster."""
+    image = image.convert("L")
+    # Body text stays legible at half size on wide captures and Tesseract moves a quarter of the pixels
+    if image.width >= OCR_DOWNSCALE_MIN_WIDTH:
+        image = image.resize((image.width // 2, image.height // 2), Image.Resampling.BILINEAR)
+    gray = np.array(image)
+    _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    return Image.fromarray(bw)
+
+def process_image(image: Image.Image, api: PyTessBaseAPI):
+    """OCR an image with an already-initialised Tesseract API (language data stays loaded)."""
+    logging.info(f"Processing {image.width}x{image.height} image for OCR")
     try:
-        image = Image.open(image_path)
-        text = pytesseract.image_to_string(image)
+        api.SetImage(binarize(image))
+        text = api.GetUTF8Text()
         logging.info(f"OCR extracted {len(text)} characters.")
         return text
     except Exception as e:
         logging.error(f"OCR failed: {e}")
         return None
 
+def wait_for_render(driver) -> None:
+    """Wait until the page has painted after a scroll, instead of sleeping a fixed time."""
+    try:
+        driver.execute_async_script(RENDER_READY_JS)
+    except TimeoutException:
+        logging.warning("Render-ready check timed out; capturing anyway")
+
+def frame_fingerprint(image: Image.Image) -> int:
+    """Hash a 16x16 grayscale thumbnail of the frame's bottom strip."""
+    strip = image.crop((0, max(0, image.height - FRAME_HASH_STRIP), image.width, image.height))
+    thumb = np.asarray(strip.convert("L").resize((16, 16), Image.Resampling.BILINEAR))
+    return xxhash.xxh64(thumb.tobytes()).intdigest()
+
+def ocr_worker(frames: queue.Queue, api: PyTessBaseAPI, accumulated_text: io.StringIO, errors: list) -> None:
+    """
+    Consumer thread: OCR encoded frames from the queue, in order, until a None sentinel.
+    A failing frame is logged, recorded in errors and skipped; the worker keeps draining
+    the queue so the producer never blocks on it.
+    """
+    previous_fingerprint = None
+    while True:
+        frame_data = frames.get()
+        if frame_data is None:
+            break
+        try:
+            # Decode in memory; no temp file round-trip per frame
+            image = Image.open(io.BytesIO(frame_data))
+            image.load()
+
+            # A frame whose bottom matches the previous frame's didn't scroll to new content;
+            # only adjacent frames are compared, since unrelated frames can share a plain strip
+            fingerprint = frame_fingerprint(image)
+            if fingerprint == previous_fingerprint:
+                logging.info("Skipping repeated frame")
+                continue
+            previous_fingerprint = fingerprint
+
+            chunk_text = process_image(image, api)
+        except Exception as e:
+            logging.exception(f"Failed to process frame: {e}")
+            errors.append(e)
+            continue
+        if chunk_text:
+            # Written straight into one buffer; no per-chunk list and a final join copy
+            if accumulated_text.tell():
+                accumulated_text.write("\n")
+            accumulated_text.write(chunk_text)
+
+def full_page_ocr(driver, api: PyTessBaseAPI) -> Optional[str]:
+    """
+    Load all lazy content, then capture the whole page in one CDP screenshot
+    (captureBeyondViewport) and OCR it once. Returns None when the page is too tall
+    for a single capture or the capture fails, so the caller can fall back to rolling_ocr.
+    """
+    scroll_to_bottom(driver)
+    width, total_height = driver.execute_script(
+        "return [document.documentElement.clientWidth, document.body.scrollHeight]"
+    )
+    if total_height > MAX_SINGLE_CAPTURE_HEIGHT:
+        logging.info(f"Page is {total_height}px tall; too tall for a single capture")
+        return None
+
+    logging.info(f"Capturing full page in one screenshot: {width}x{total_height}")
+    try:
+        result = driver.execute_cdp_cmd("Page.captureScreenshot", {
+            **CAPTURE_FORMAT,
+            "captureBeyondViewport": True,
+            "clip": {"x": 0, "y": 0, "width": width, "height": total_height, "scale": 1},
+        })
+    except Exception as e:
+        logging.warning(f"Full-page capture failed: {e}")
+        return None
+
+    image = Image.open(io.BytesIO(b64decode(result["data"])))
+    image.load()
+    return process_image(image, api)
+
+def rolling_ocr(driver, api: PyTessBaseAPI) -> str:
+    """Scroll through the page a viewport at a time, OCRing each frame; returns the combined text."""
+    # This thread scrolls and captures while a worker OCRs the previous frames (bounded queue, so capture can't run far ahead of OCR)
+    accumulated_text = io.StringIO()
+    errors = []
+    frames = queue.Queue(maxsize=4)
+    ocr_thread = threading.Thread(target=ocr_worker, args=(frames, api, accumulated_text, errors), daemon=True)
+    ocr_thread.start()
+
+    frames_queued = 0
+
+    # 80% of the viewport per step to ensure overlap but progress
+    scroll_step = driver.execute_script("return window.innerHeight") * 0.8
+
+    logging.info("Starting Rolling OCR...")
+
+    try:
+        while True:
+            # Capture current viewport with retry using CDP
+            max_retries = 3
+            frame_data = None
+
+            for attempt in range(max_retries):
+                try:
+                    # Use CDP which is often faster/more robust than standard save_screenshot
+                    result = driver.execute_cdp_cmd("Page.captureScreenshot", CAPTURE_FORMAT)
+                    frame_data = b64decode(result['data'])
+                    break
+                except Exception as e:
+                    logging.warning(f"Screenshot attempt {attempt+1} failed: {e}")
+                    time.sleep(2)
+
+            if frame_data:
+                frames.put(frame_data)
+                frames_queued += 1
+            else:
+                logging.error("Failed to capture screenshot after retries. Skipping frame.")
+
+            # Stop once this frame reached the bottom, otherwise scroll down
+            _, _, at_bottom = driver.execute_script(SCROLL_STEP_JS, scroll_step)
+            if at_bottom:
+                break
+            wait_for_render(driver)
+    finally:
+        # Let the worker drain queued frames before the OCR engine is released
+        frames.put(None)
+        ocr_thread.join()
+
+    # A bad frame only loses its own text; give up only when no frame could be processed
+    if errors:
+        if len(errors) == frames_queued:
+            raise errors[0]
+        logging.warning(f"{len(errors)} of {frames_queued} frames failed OCR and were skipped")
+
+    logging.info("Rolling OCR complete.")
+    return accumulated_text.getvalue()
+
+def summarize_ocr_text(full_text: str) -> None:
+    """Send OCR text to Ollama and print the extracted profile summary."""
+    logging.info("Sending accumulated text to Ollama...")
+    client = OllamaClient()
+    # Updated prompt to handle repetition and noise
+    prompt = """
+    The following text is extracted from a LinkedIn profile using rolling OCR screenshots. 
+    There may be duplicate text or noise (like navigation bars). 
+    Ignore the noise and duplicates.
+
+    Extract:
+    1. Candidate Name (Look at the main profile header, NOT the navbar user)
+    2. Headline
+    3. Current Company
+    4. Summary of Skills
+    5. Experience Summary
+    """
+
+    summary = client.process_profile({"raw_ocr_text": full_text}, custom_prompt=prompt)
+
+    print("\n" + "="*50)
+    print("OLLAMA SUMMARY")
+    print("="*50)
+    print(summary)
+    print("="*50 + "\n")
+
 def main():
     parser = argparse.ArgumentParser(description="Visual LinkedIn Scraper")
     parser.add_argument("--url", type=str, required=True, help="Profile URL")
@@ -185,6 +393,25 @@ def main():
     parser.add_argument("--headless", action="store_true", help="Headless mode")
     
     args = parser.parse_args()
+
+    target_url = args.url
+    if not target_url.startswith("http"):
+        target_url = "https://" + target_url
+
+    # Skip Chrome entirely for server-rendered pages; an attached (logged-in) Chrome is
+    # only used for gated pages, so don't second-guess it
+    if not args.running:
+        static = WebsiteScraper().scrape(target_url)
+        if not static["error"] and len(static["raw_text"]) >= STATIC_TEXT_THRESHOLD:
+            logging.info("Page is server-rendered; using plain HTML text instead of Selenium + OCR")
+            with open("ocr_text.txt", "w") as f:
+                f.write(static["raw_text"])
+            summarize_ocr_text(static["raw_text"])
+            return
+
+    # One Tesseract engine for the whole session instead of a tesseract process per frame;
+    # PSM 6 (single uniform block) skips full page-layout analysis
+    ocr_api = PyTessBaseAPI(lang="eng", psm=PSM.SINGLE_BLOCK)
     
     driver = get_selenium_drivers(
         running=args.running, 
@@ -197,11 +424,6 @@ def main():
     driver.set_script_timeout(30)
     
     try:
-
-        target_url = args.url
-        if not target_url.startswith("http"):
-            target_url = "https://" + target_url
-            
         # Navigate if not already there
         if driver.current_url != target_url:
             logging.info(f"Navigating to {target_url}")
@@ -229,92 +451,22 @@ def main():
             logging.warning(f"Could not resize window: {e}")
         time.sleep(1)
 
-        # Rolling OCR Loop
-        accumulated_text = []
-        
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        viewport_height = driver.execute_script("return window.innerHeight")
-        scroll_position = 0
-        
-        logging.info("Starting Rolling OCR...")
-        
-        while True:
-            # Capture current viewport with retry using CDP
-            max_retries = 3
-            png_data = None
-            
-            for attempt in range(max_retries):
-                try:
-                    # Use CDP which is often faster/more robust than standard save_screenshot
-                    result = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "png"})
-                    png_data = b64decode(result['data'])
-                    break
-                except Exception as e:
-                    logging.warning(f"Screenshot attempt {attempt+1} failed: {e}")
-                    time.sleep(2)
-            
-            if png_data:
-                with open("temp_viewport.png", "wb") as f:
-                    f.write(png_data)
-                
-                # OCR the chunk
-                chunk_text = process_image("temp_viewport.png")
-                if chunk_text:
-                    accumulated_text.append(chunk_text)
-            else:
-                logging.error("Failed to capture screenshot after retries. Skipping frame.")
-            
-            # Scroll down
-            scroll_position += (viewport_height * 0.8) # 80% scroll to ensure overlap but progress
-            driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-            time.sleep(3) # Increased wait time for renderer to catch up
-            
-            # Check if we reached bottom
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if scroll_position >= new_height:
-                break
-                
-        logging.info("Rolling OCR complete.")
-        
-        # Combine text
-        full_text = "\n".join(accumulated_text)
+        # One capture of the whole page when it fits; otherwise fall back to rolling OCR
+        full_text = full_page_ocr(driver, ocr_api)
+        if full_text is None:
+            full_text = rolling_ocr(driver, ocr_api)
         
         # Save raw text
         with open("ocr_text.txt", "w") as f:
             f.write(full_text)
             
         if full_text:
-            logging.info("Sending accumulated text to Ollama...")
-            client = OllamaClient()
-            # Updated prompt to handle repetition and noise
-            prompt = """
-            The following text is extracted from a LinkedIn profile using rolling OCR screenshots. 
-            There may be duplicate text or noise (like navigation bars). 
-            Ignore the noise and duplicates.
-            
-            Extract:
-            1. Candidate Name (Look at the main profile header, NOT the navbar user)
-            2. Headline
-            3. Current Company
-            4. Summary of Skills
-            5. Experience Summary
-            """
-            
-            summary = client.process_profile({"raw_ocr_text": full_text}, custom_prompt=prompt)
-            
-            print("\n" + "="*50)
-            print("OLLAMA SUMMARY")
-            print("="*50)
-            print(summary)
-            print("="*50 + "\n")
-            
-        # Cleanup
-        if os.path.exists("temp_viewport.png"):
-            os.remove("temp_viewport.png")
+            summarize_ocr_text(full_text)
                 
     except Exception as e:
         logging.exception(f"Error: {e}")
     finally:
+        ocr_api.End()
         if not args.running:
             driver.quit()
 
@@ -1,7 +1,22 @@
 
+import threading
+
 import matplotlib.pyplot as plt
 import numpy as np
 
+# One figure reused for every chart (cleared per call) instead of creating and closing
+# a figure per candidate; the lock serialises threads drawing on it
+_FIG = None
+_AX = None
+_LOCK = threading.Lock()
+
+def _get_axes():
+    """Create the shared polar figure on first use."""
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
+    return _FIG, _AX
+
 def plot_pentagram(grades, filename="pentagram_grade.png"):
     """
     Plot a radar chart for the given grades.
@@ -13,23 +28,33 @@ def plot_pentagram(grades, filename="pentagram_grade.png"):
     values = [grades.get(c, 0) for c in categories]
     
     # Close the loop
-    values += values[:1]
+    values = np.asarray(values + values[:1])
     
     # Angles
     N = len(categories)
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    angles += angles[:1]
+    angles = np.concatenate([np.linspace(0, 2 * np.pi, N, endpoint=False), [0.0]])
     
+    with _LOCK:
+        _draw_pentagram(angles, values, categories, filename)
+    print(f"Graph saved to {filename}")
+
+def _draw_pentagram(angles, values, categories, filename):
+    """Draw the chart on the shared axes and save it. Caller holds _LOCK."""
+    N = len(categories)
+
     # Initialise the spider plot
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
+    fig, ax = _get_axes()
+    ax.clear()
     
     # Draw one axe per variable + add labels
-    plt.xticks(angles[:-1], categories)
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(categories)
     
     # Draw ylabels
     ax.set_rlabel_position(0)
-    plt.yticks([20,40,60,80,100], ["20","40","60","80","100"], color="grey", size=7)
-    plt.ylim(0,100)
+    ax.set_yticks([20,40,60,80,100])
+    ax.set_yticklabels(["20","40","60","80","100"], color="grey", size=7)
+    ax.set_ylim(0,100)
     
     # Reference Quantiles (Approximations/Targets)
     # Top 1% = 98, Top 5% = 90, Top 10% = 85, Top 15% = 80, Top 20% = 75
@@ -41,24 +66,22 @@ def plot_pentagram(grades, filename="pentagram_grade.png"):
         (75, '20%', 'green')
     ]
     
-    for score, label, color in quantiles:
-        # Plot circle/polygon for this quantile
-        q_values = [score] * N
-        q_values += q_values[:1]
-        ax.plot(angles, q_values, linewidth=1, linestyle='dashed', color=color, label=f"Top {label}")
-        # ax.fill(angles, q_values, color=color, alpha=0.1)
+    # One polygon per quantile, all drawn by a single plot call (one column per quantile)
+    scores = np.array([score for score, _, _ in quantiles])
+    lines = ax.plot(angles, np.tile(scores, (N + 1, 1)), linewidth=1, linestyle='dashed')
+    for line, (_, label, color) in zip(lines, quantiles):
+        line.set_color(color)
+        line.set_label(f"Top {label}")
 
     # Plot data
     ax.plot(angles, values, linewidth=2, linestyle='solid', label='Candidate')
     ax.fill(angles, values, 'b', alpha=0.2)
     
     # Add legend
-    plt.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
+    ax.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
     
-    plt.title("Candidate Evaluation Pentagram")
-    plt.savefig(filename)
-    plt.close()
-    print(f"Graph saved to {filename}")
+    ax.set_title("Candidate Evaluation Pentagram")
+    fig.savefig(filename)
 
 if __name__ == "__main__":
     # Test
@@ -1,10 +1,28 @@
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 
 class WebsiteScraper:
+    # Compiled/built once for all instances instead of on every call
+    # Pattern: 2-4 consecutive capitalized words. Stays on `re`: its Unicode-aware \b keeps
+    # "Dupré" from matching as "Dupr", which RE2's ASCII-only \b would allow
+    _COMPANY_RE = re.compile(r'\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})\b')
+    # Common trailing title patterns like " | Portfolio", " - Home"
+    _TITLE_SUFFIX_RE = re.compile(r'[\|\-–—].*$')
+    _WHITESPACE_RE = re.compile(r'\s+')
+    # The only tags _extract_name looks at
+    _NAME_TAGS = SoupStrainer(["meta", "h1", "title"])
+    # Capitalized words that don't make a company/project name on their own
+    _STOP = frozenset({
+        "The", "This", "These", "Those", "What", "Where", "When", "How",
+        "About", "Contact", "Home", "Blog", "Work", "My", "Our", "We",
+        "You", "He", "She", "They", "It", "Its", "And", "For", "With",
+        "From", "Into", "Over", "Under", "Through", "Between", "During"
+    })
+
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
         self.headers = {
@@ -14,6 +32,9 @@ class WebsiteScraper:
                 "Chrome/120.0.0.0 Safari/537.36"
             )
         }
+        # Keep-alive session so repeated scrapes reuse the TCP/TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     def scrape(self, url: str) -> Dict:
         """
@@ -30,16 +51,17 @@ class WebsiteScraper:
             return {"name": None, "companies": [], "raw_text": "", "error": "invalid URL"}
 
         try:
-            resp = requests.get(url, headers=self.headers, timeout=self.timeout)
+            resp = self.session.get(url, timeout=self.timeout)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            # Raw bytes + lxml: libxml2 parses and detects the encoding in C
+            soup = BeautifulSoup(resp.content, "lxml")
 
             # Strip scripts/styles for clean text
             for tag in soup(["script", "style", "noscript", "nav", "footer"]):
                 tag.decompose()
 
             raw_text = soup.get_text(separator=" ", strip=True)
-            raw_text = re.sub(r'\s+', ' ', raw_text).strip()
+            raw_text = self._WHITESPACE_RE.sub(' ', raw_text).strip()
 
             name = self._extract_name(soup)
             companies = self._extract_companies(raw_text)
@@ -51,24 +73,57 @@ class WebsiteScraper:
                 "error": None
             }
 
-        except requests.exceptions.Timeout:
-            return {"name": None, "companies": [], "raw_text": "", "error": "timeout"}
-        except requests.exceptions.ConnectionError:
-            return {"name": None, "companies": [], "raw_text": "", "error": "connection error"}
-        except requests.exceptions.HTTPError as e:
-            return {"name": None, "companies": [], "raw_text": "", "error": f"HTTP {e.response.status_code}"}
         except Exception as e:
-            return {"name": None, "companies": [], "raw_text": "", "error": str(e)}
+            return {"name": None, "companies": [], "raw_text": "", "error": self._error_message(e)}
+
+    def scrape_name_only(self, url: str) -> Dict:
+        """
+        Cheaper variant of scrape() when only the owner name is needed: only <meta>, <h1>
+        and <title> tags are built into the tree.
+        Returns:
+            {"name": str|None, "error": str|None}
+        """
+        if not url or not url.startswith("http"):
+            return {"name": None, "error": "invalid URL"}
+
+        try:
+            resp = self.session.get(url, timeout=self.timeout)
+            resp.raise_for_status()
+            soup = BeautifulSoup(resp.content, "lxml", parse_only=self._NAME_TAGS)
+            return {"name": self._extract_name(soup), "error": None}
+        except Exception as e:
+            return {"name": None, "error": self._error_message(e)}
+
+    @staticmethod
+    def _error_message(e: Exception) -> str:
+        """Short error label for a failed fetch/parse."""
+        if isinstance(e, requests.exceptions.Timeout):
+            return "timeout"
+        if isinstance(e, requests.exceptions.ConnectionError):
+            return "connection error"
+        if isinstance(e, requests.exceptions.HTTPError):
+            return f"HTTP {e.response.status_code}"
+        return str(e)
+
+    def scrape_many(self, urls: List[str], max_workers: int = 16) -> List[Dict]:
+        """Scrape several URLs concurrently over the shared session; results keep the order of urls."""
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+            return list(pool.map(self.scrape, urls))
 
     def _extract_name(self, soup: BeautifulSoup) -> Optional[str]:
         """Try to extract the person/site owner name from common HTML signals."""
-        # 1. Open Graph author/title meta
+        # 1. Open Graph author/title meta — one walk over the <meta> tags (first one per key wins)
+        metas = {}
+        for tag in soup.find_all("meta"):
+            key = (tag.get("property") or tag.get("name") or "").lower()
+            if key:
+                metas.setdefault(key, (tag.get("content") or "").strip())
         for attr in ["og:title", "author", "twitter:title"]:
-            tag = soup.find("meta", property=attr) or soup.find("meta", attrs={"name": attr})
-            if tag and tag.get("content"):
-                candidate = tag["content"].strip()
-                if candidate and len(candidate) < 60:
-                    return candidate
+            candidate = metas.get(attr)
+            if candidate and len(candidate) < 60:
+                return candidate
 
         # 2. <h1> tag — most personal sites use this for their name
         h1 = soup.find("h1")
@@ -82,7 +137,7 @@ class WebsiteScraper:
         if title:
             candidate = title.get_text(strip=True)
             # Remove common trailing patterns like " | Portfolio", " - Home"
-            candidate = re.sub(r'[\|\-–—].*$', '', candidate).strip()
+            candidate = self._TITLE_SUFFIX_RE.sub('', candidate).strip()
             if candidate and len(candidate) < 60:
                 return candidate
 
@@ -90,25 +145,19 @@ class WebsiteScraper:
 
     def _extract_companies(self, text: str) -> List[str]:
         """Extract capitalized multi-word phrases that could be company/project names."""
-        # Pattern: 2-4 consecutive capitalized words
-        pattern = re.compile(r'\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})\b')
-        candidates = pattern.findall(text)
+        candidates = self._COMPANY_RE.findall(text)
 
         # Deduplicate while preserving order, filter common false positives
         seen = set()
-        stop = {
-            "The", "This", "These", "Those", "What", "Where", "When", "How",
-            "About", "Contact", "Home", "Blog", "Work", "My", "Our", "We",
-            "You", "He", "She", "They", "It", "Its", "And", "For", "With",
-            "From", "Into", "Over", "Under", "Through", "Between", "During"
-        }
         results = []
         for c in candidates:
-            words = c.split()
-            if all(w in stop for w in words):
+            # Repeats are skipped before any word-level work
+            if c in seen:
+                continue
+            seen.add(c)
+            # Phrases made only of stop words are dropped (one C-level subset test)
+            if self._STOP.issuperset(c.split()):
                 continue
-            if c not in seen:
-                seen.add(c)
-                results.append(c)
+            results.append(c)
 
         return results[:20]